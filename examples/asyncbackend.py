@@ -0,0 +1,121 @@
+"""
+Module for using the backend module asynchronously, off the GUI thread.
+"""
+
+import concurrent.futures
+import functools
+import logging
+from typing import Any, Callable, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from examples import backend
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBackend(QObject):
+    """Facade which runs the backend functions on a worker thread.
+
+    The requests are queued and run one by one in the order of submission on its own
+    worker thread, which keeps the database connections of the thread open.
+    See backend.ConnectionPool. Therefore, a slow disk or a locked database does not
+    block the thread of the caller, e.g., the GUI thread.
+
+    The result of each request is given to its callback on the thread of this object,
+      i.e., the GUI thread for an object created there. The callbacks are not called
+      after this object is destroyed, but the queued requests still run.
+    """
+
+    _finished = pyqtSignal(object, object)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """Extended."""
+        super().__init__(parent=parent)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="AsyncBackend"
+        )
+        self._finished.connect(self._callback)
+        self.destroyed.connect(functools.partial(self._executor.shutdown, wait=False))
+
+    def submit(
+        self,
+        function: Callable,
+        *args: Any,
+        callback: Optional[Callable[[Any], Any]] = None,
+    ) -> concurrent.futures.Future:
+        """Queues a request for calling the function on the worker thread.
+
+        Args:
+            function: The function to call. It should not touch any widget.
+            *args: The arguments of the function.
+            callback: The function which is called with the returned value.
+              If the function raises an exception, it is logged and the callback is called
+              with None.
+
+        Returns:
+            The future of the returned value.
+        """
+        future = self._executor.submit(function, *args)
+        if callback is not None:
+            future.add_done_callback(functools.partial(self._finish, callback))
+        return future
+
+    def read(
+        self,
+        db_path: str,
+        table: str,
+        callback: Optional[Callable[[Any], Any]] = None,
+    ) -> concurrent.futures.Future:
+        """Queues a request for backend.read().
+
+        Args:
+            db_path, table: See backend.read().
+            callback: See submit().
+        """
+        return self.submit(backend.read, db_path, table, callback=callback)
+
+    def write(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        db_path: str,
+        table: str,
+        value: Any,
+        callback: Optional[Callable[[Optional[bool]], Any]] = None,
+        buffer: Optional[backend.WriteBehindBuffer] = None,
+    ) -> concurrent.futures.Future:
+        """Queues a request for backend.write().
+
+        Args:
+            db_path, table, value, buffer: See backend.write().
+            callback: See submit().
+        """
+        return self.submit(backend.write, db_path, table, value, buffer, callback=callback)
+
+    def _finish(self, callback: Callable[[Any], Any], future: concurrent.futures.Future):
+        """Delivers the finished future to the thread of this object.
+
+        It is called on the worker thread, or on the caller thread if the future is
+        already finished when the callback is added.
+
+        Args:
+            callback: See submit().
+            future: The finished future.
+        """
+        try:
+            self._finished.emit(callback, future)
+        except RuntimeError:
+            logger.debug("The result is discarded since the backend is destroyed")
+
+    @pyqtSlot(object, object)
+    def _callback(self, callback: Callable[[Any], Any], future: concurrent.futures.Future):
+        """Calls the callback with the result of the future.
+
+        Args:
+            See _finish().
+        """
+        try:
+            result = future.result()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to run a backend request")
+            result = None
+        callback(result)
@@ -2,14 +2,318 @@
 Backend module for offering various functions.
 """
 
+import atexit
 import random
 import time
 import logging
 import sqlite3
-from typing import Any
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class ConnectionPool:
+    """Pool of sqlite connections which are kept open for each database path and thread.
+
+    Since a sqlite connection can only be used in the thread where it is created,
+      each thread has its own connections. The idle connections are closed lazily
+      when the same thread gets a connection, and the connections of a thread are
+      closed when the thread ends.
+
+    The databases are set to WAL journal mode by default, so that the readers do not
+      block the writer and vice versa. A writer still waits for another writer up to
+      busyTimeout, and the operations given to run() are retried when the database is
+      still busy or locked.
+
+    Attributes:
+        idleTimeout: The time in seconds after which an unused connection is closed.
+        journalMode: The journal mode set to the databases, e.g., "WAL" or "DELETE".
+          None for keeping the journal mode of each database.
+        busyTimeout: The time in seconds for a statement to wait for a lock.
+        retries: The maximum number of retries of an operation in run().
+        backoff: The wait time in seconds before the first retry in run().
+          It is doubled for each retry.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        idleTimeout: float = 60,
+        journalMode: Optional[str] = "WAL",
+        busyTimeout: float = 5,
+        retries: int = 5,
+        backoff: float = 0.01,
+    ):
+        """
+        Args:
+            See the attributes section.
+        """
+        self.idleTimeout = idleTimeout
+        self.journalMode = journalMode
+        self.busyTimeout = busyTimeout
+        self.retries = retries
+        self.backoff = backoff
+        self._local = threading.local()
+
+    def _connections(self) -> Dict[str, List]:
+        """Returns the dictionary of the connections of the current thread.
+
+        Its keys are database paths and values are [connection, last used time, cache] lists.
+        See cache() for the cache.
+        """
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        return connections
+
+    def connection(self, db_path: str) -> sqlite3.Connection:
+        """Returns an open connection to the database for the current thread.
+
+        Args:
+            db_path: A path of database file.
+        """
+        connections = self._connections()
+        now = time.monotonic()
+        for path, (con, lastUsed, _) in tuple(connections.items()):
+            if now - lastUsed >= self.idleTimeout:
+                del connections[path]
+                con.close()
+        entry = connections.get(db_path)
+        if entry is None:
+            entry = connections[db_path] = [self._connect(db_path), now, {}]
+        else:
+            entry[1] = now
+        return entry[0]
+
+    def cache(self, db_path: str) -> Dict[Any, Any]:
+        """Returns the cache dictionary of the connection to the database for the current thread.
+
+        The cache is discarded with the connection. It is for caching the values with
+          "PRAGMA data_version" of the connection, which changes when another connection
+          commits changes, but not when this connection does.
+        It should be called in an operation of run(), i.e., while the connection is open.
+
+        Args:
+            db_path: A path of database file.
+        """
+        return self._local.connections[db_path][2]
+
+    def _connect(self, db_path: str) -> sqlite3.Connection:
+        """Returns a new connection to the database with the journal mode set.
+
+        Args:
+            db_path: A path of database file.
+        """
+        con = sqlite3.connect(db_path, timeout=self.busyTimeout)
+        if self.journalMode is not None:
+            try:
+                con.execute(f"PRAGMA journal_mode = {self.journalMode}")
+            except sqlite3.Error:
+                logger.warning("Failed to set the journal mode of database %s to %s",
+                               db_path, self.journalMode, exc_info=True)
+        return con
+
+    def run(self, db_path: str, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Runs the operation with a connection to the database and returns its result.
+
+        If the database is busy or locked, it retries the operation with exponential backoff.
+        The operation should be a single transaction so that it can be retried.
+
+        Args:
+            db_path: A path of database file.
+            operation: A function which takes a connection and uses it.
+        """
+        attempt = 0
+        while True:
+            try:
+                return operation(self.connection(db_path))
+            except sqlite3.OperationalError as error:
+                message = str(error)
+                if attempt >= self.retries or ("locked" not in message
+                                               and "busy" not in message):
+                    raise
+                logger.debug("Retrying an operation on database %s: %s", db_path, message)
+            time.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+
+    def discard(self, db_path: str):
+        """Closes the connection to the database of the current thread, if any.
+
+        It is called after an error, so that the next call makes a new connection.
+
+        Args:
+            db_path: A path of database file.
+        """
+        entry = self._connections().pop(db_path, None)
+        if entry is not None:
+            entry[0].close()
+
+    def close(self):
+        """Closes all the connections of the current thread."""
+        connections = self._connections()
+        for con, *_ in connections.values():
+            con.close()
+        connections.clear()
+
+
+# the connection pool used by read(), write() and WriteBehindBuffer
+pool = ConnectionPool()
+
+
+class WriteBehindBuffer:  # pylint: disable=too-many-instance-attributes
+    """Buffer which writes the rows into databases in batches on a worker thread.
+
+    The rows are buffered for each database path and table, and each buffer is
+    written by executemany() in a single transaction, hence with a single disk sync.
+    All the buffers are written when any of them has maxRows rows, when the oldest row
+    has waited for flushInterval seconds, when flush() is called, and at exit.
+
+    Attributes:
+        maxRows: The number of rows in a buffer which triggers writing.
+        flushInterval: The maximum time in seconds for a row to wait.
+        synchronous: The value of "PRAGMA synchronous" for the connections of the worker,
+          i.e., "OFF", "NORMAL", "FULL" or "EXTRA". It trades durability for speed.
+          None for the default of sqlite.
+        errorCallback: A function called on the worker thread when writing a buffer fails,
+          with the database path, the table name, the rows and the exception.
+          The rows are discarded after it is called. If None, the error is logged.
+    """
+
+    def __init__(
+        self,
+        maxRows: int = 1000,
+        flushInterval: float = 1,
+        synchronous: Optional[str] = None,
+        errorCallback: Optional[Callable[[str, str, List[Tuple], Exception], Any]] = None,
+    ):
+        """
+        Args:
+            See the attributes section.
+        """
+        self.maxRows = maxRows
+        self.flushInterval = flushInterval
+        self.synchronous = synchronous
+        self.errorCallback = errorCallback
+        self._buffers: Dict[Tuple[str, str], List[Tuple]] = {}
+        self._deadline: Optional[float] = None
+        self._isFull = False
+        self._isClosed = False
+        self._isStopped = False
+        self._flushRequested = self._flushDone = 0
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="WriteBehind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, db_path: str, table: str, row: Tuple):
+        """Buffers the row to write into the table.
+
+        Args:
+            db_path: A path of database file.
+            table: A name of table to write down.
+            row: The values of the row.
+        """
+        with self._condition:
+            if self._isClosed or self._isStopped:
+                raise RuntimeError("The write-behind buffer is already closed.")
+            rows = self._buffers.setdefault((db_path, table), [])
+            rows.append(row)
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self.flushInterval
+                self._condition.notify_all()
+            if len(rows) >= self.maxRows and not self._isFull:
+                self._isFull = True
+                self._condition.notify_all()
+
+    def flush(self):
+        """Writes all the buffered rows and waits until they are written.
+
+        It returns without waiting if the worker thread is not running.
+        """
+        with self._condition:
+            self._flushRequested += 1
+            request = self._flushRequested
+            self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: self._flushDone >= request or self._isClosed or self._isStopped
+                or not self._thread.is_alive()
+            )
+
+    def close(self):
+        """Writes all the buffered rows and stops the worker thread."""
+        with self._condition:
+            if self._isClosed:
+                return
+            self._isClosed = True
+            self._condition.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _isDue(self) -> bool:
+        """Returns whether the buffers should be written now."""
+        return (self._isClosed or self._isFull or self._flushRequested > self._flushDone
+                or self._deadline is not None and time.monotonic() >= self._deadline)
+
+    def _run(self):
+        """Writes the buffers whenever they are due until the buffer is closed."""
+        try:
+            self._writeBuffers()
+        finally:
+            with self._condition:
+                self._isStopped = True
+                self._condition.notify_all()
+
+    def _writeBuffers(self):
+        """Writes the buffers whenever they are due until the buffer is closed.
+
+        It is the loop of the worker thread. See _run().
+        """
+        while True:
+            with self._condition:
+                while not self._isDue():
+                    timeout = None if self._deadline is None else self._deadline - time.monotonic()
+                    self._condition.wait(timeout)
+                buffers, self._buffers = self._buffers, {}
+                self._deadline, self._isFull = None, False
+                request, isClosed = self._flushRequested, self._isClosed
+            for (db_path, table), rows in buffers.items():
+                self._write(db_path, table, rows)
+            with self._condition:
+                self._flushDone = request
+                self._condition.notify_all()
+            if isClosed:
+                pool.close()
+                return
+
+    def _write(self, db_path: str, table: str, rows: List[Tuple]):
+        """Writes the rows into the table in a single transaction.
+
+        Args:
+            See put().
+        """
+        def operation(con: sqlite3.Connection):
+            if self.synchronous is not None:
+                con.execute(f"PRAGMA synchronous = {self.synchronous}")
+            with con:
+                con.executemany(
+                    f"INSERT INTO {table} VALUES ({', '.join('?' * len(rows[0]))})", rows
+                )
+        try:
+            pool.run(db_path, operation)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            pool.discard(db_path)
+            if self.errorCallback is None:
+                logger.exception("Failed to write %d rows into table %s of database %s",
+                                 len(rows), table, db_path)
+                return
+            try:
+                self.errorCallback(db_path, table, rows, error)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("The error callback failed for %d rows of table %s of "
+                                 "database %s", len(rows), table, db_path)
+
 
 def generate() -> int:
     """Generates a random number from 0 to 99.
@@ -33,14 +337,24 @@ def read(db_path: str, table: str) -> Any:
     """Reads the value from the database.
 
     It can only read the last row in a specific table.
+    The connection is reused from the pool of this module. See ConnectionPool.
+
+    The last value of each table is cached with "PRAGMA data_version" of the connection,
+      and it is read again only if another connection commits changes. The values written
+      by write() with the same connection, i.e., in the same thread, are cached as well.
 
     Database structure:
         There is at least one table and in the table, there is at least one column.
         The value to read should be in the first column.
+        If there is the second column, it is the time when the row is written.
+        It is the epoch time in seconds if its declared type is numeric, e.g., REAL,
+          as in the tables made by create_table(). Otherwise, it is the local date-time
+          text, e.g., "2023-01-01 12:34:56". See read_range() for reading the rows by time.
 
     Error handling:
-        An error may occur if it tries to access the database before another one commits.
-        If so, the error will be catched by try-except statement and showed.
+        The database is in WAL journal mode by default, so reading does not wait for
+        writing, and a busy or locked database is retried. See ConnectionPool.
+        If an error still occurs, it will be catched by try-except statement and showed.
         See the returning value in returns description. 
 
     Args:
@@ -53,32 +367,50 @@ def read(db_path: str, table: str) -> Any:
     """
     if db_path == "":
         return None
-    con = sqlite3.connect(db_path)
-    try:
+    def operation(con: sqlite3.Connection) -> Any:
+        version = con.execute("PRAGMA data_version").fetchone()[0]
+        cache = pool.cache(db_path)
+        cached = cache.get(table)
+        if cached is not None and cached[0] == version:
+            return cached[1]
         with con:
             value = con.execute(
                 f"SELECT * FROM {table} ORDER BY rowid DESC LIMIT 1"
             ).fetchone()[0]
+        cache[table] = (version, value)
+        return value
+    try:
+        value = pool.run(db_path, operation)
     except sqlite3.Error:
         logger.exception("Failed to read table %s from database %s.", table, db_path)
+        pool.discard(db_path)
         return None
-    finally:
-        con.close()
     return value
 
 
-def write(db_path: str, table: str, value: Any) -> bool:
+def write(
+    db_path: str,
+    table: str,
+    value: Any,
+    buffer: Optional[WriteBehindBuffer] = None,
+) -> bool:
     """Writes the value to the database.
 
     It can only add the value into the last row in a specific table.
     The value and saved time are read in the first and second column, respectively. 
+    The connection is reused from the pool of this module. See ConnectionPool.
+
+    If a buffer is given, the row is buffered with the current time and written later.
+    In this case, the returned value only means that the row is buffered, and the errors
+    are reported by the buffer. See WriteBehindBuffer.
 
     Database structure:
         See read().
 
     Error handling:
-        An error may occur if it tries to access the database before another one commits.
-        If so, the error will be catched by try-except statement and showed.
+        The database is in WAL journal mode by default, so reading does not wait for
+        writing, and a busy or locked database is retried. See ConnectionPool.
+        If an error still occurs, it will be catched by try-except statement and showed.
         See the returning value in returns description. 
 
     Args:
@@ -86,22 +418,198 @@ def write(db_path: str, table: str, value: Any) -> bool:
           It will be an empty string if the user does not select a specific database.
         table: A name of table to write down.
         value: A value to write to the given location.
+        buffer: A write-behind buffer for writing the row. If None, it is written at once.
 
     Returns:
         True if writing is successful, otherwise False.
     """
     if db_path == "":
         return False
-    con = sqlite3.connect(db_path)
-    try:
+    now = time.time()
+    def operation(con: sqlite3.Connection):
+        row = (value, now if _is_epoch_table(con, db_path, table) else _local_text(now))
+        if buffer is not None:
+            buffer.put(db_path, table, row)
+            return
+        # the own commit does not change the data version, and the commits of the others
+        # after this change it, which invalidates the cached value
+        version = con.execute("PRAGMA data_version").fetchone()[0]
         with con:
-            con.execute(
-                f"INSERT INTO {table} VALUES (?, datetime('now', 'localtime'))", 
-                (value,)
-            )
+            con.execute(f"INSERT INTO {table} VALUES (?, ?)", row)
+        pool.cache(db_path)[table] = (version, value)
+    try:
+        pool.run(db_path, operation)
     except sqlite3.Error:
         logger.exception("Failed to write a value into table %s of database %s", table, db_path)
+        pool.discard(db_path)
+        return False
+    return True
+
+
+def create_table(db_path: str, table: str) -> bool:
+    """Creates the table with the epoch time column and its index, if it does not exist.
+
+    See read() for the database structure.
+
+    Args:
+        db_path: A path of database file.
+        table: A name of table to create.
+
+    Returns:
+        True if the table exists or is created successfully, otherwise False.
+    """
+    def operation(con: sqlite3.Connection):
+        with con:
+            con.execute(f"CREATE TABLE IF NOT EXISTS {table} (value, time REAL NOT NULL)")
+            con.execute(f"CREATE INDEX IF NOT EXISTS {table}_time ON {table} (time)")
+    try:
+        pool.run(db_path, operation)
+    except sqlite3.Error:
+        logger.exception("Failed to create table %s of database %s", table, db_path)
         return False
+    return True
+
+
+def iter_rows(
+    db_path: str,
+    table: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    chunk_size: int = 1000,
+) -> Iterator[Tuple]:
+    """Iterates the rows of the table written in the time range, in the order of time.
+
+    The rows are fetched by chunks, so the memory usage does not depend on the number
+      of the rows. It uses its own connection, which is closed when the iteration ends
+      or the generator is closed, and it reads a consistent snapshot of the database.
+    If the time column is not indexed, it creates the index.
+
+    Args:
+        db_path: A path of database file.
+        table: A name of table to read.
+        start: If given, only the rows written at or after this epoch time are iterated.
+        end: If given, only the rows written before this epoch time are iterated.
+        chunk_size: The number of rows fetched at once.
+
+    Yields:
+        The rows as they are stored. See read() for the database structure.
+
+    Raises:
+        sqlite3.Error: When reading the table fails.
+    """
+    con = sqlite3.connect(db_path, timeout=pool.busyTimeout)
+    try:
+        cursor = con.execute(*_range_query(con, table, start, end))
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield from rows
     finally:
         con.close()
-    return True
+
+
+def read_range(
+    db_path: str,
+    table: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> Optional[List[Tuple]]:
+    """Reads the rows of the table written in the time range, in the order of time.
+
+    For a large range, use iter_rows() instead, which does not keep all the rows.
+
+    Args:
+        See iter_rows().
+
+    Returns:
+        The list of the rows if reading is successful, otherwise None.
+    """
+    if db_path == "":
+        return None
+    try:
+        return list(iter_rows(db_path, table, start, end))
+    except sqlite3.Error:
+        logger.exception("Failed to read rows from table %s of database %s.", table, db_path)
+        return None
+
+
+def _range_query(
+    con: sqlite3.Connection,
+    table: str,
+    start: Optional[float],
+    end: Optional[float],
+) -> Tuple[str, List[Any]]:
+    """Returns the query and its parameters for selecting the rows in the time range.
+
+    Args:
+        con: A connection to the database.
+        table, start, end: See iter_rows().
+    """
+    columns = [row[1] for row in con.execute(f"PRAGMA table_info({table})")]
+    if len(columns) < 2:
+        raise sqlite3.OperationalError(f"The table {table} has no time column")
+    column = columns[1]
+    isEpoch = _is_epoch_table(con, None, table)
+    _ensure_index(con, table, column)
+    conditions, parameters = [], []
+    for bound, operator in ((start, ">="), (end, "<")):
+        if bound is not None:
+            conditions.append(f"{column} {operator} ?")
+            parameters.append(bound if isEpoch else _local_text(bound))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"SELECT * FROM {table} {where} ORDER BY {column}", parameters
+
+
+def _is_epoch_table(con: sqlite3.Connection, db_path: Optional[str], table: str) -> bool:
+    """Returns whether the time column of the table stores the epoch time.
+
+    It is the case if the declared type of the column, i.e., the second column, has
+      "INT", "REAL", "FLOA", "DOUB" or "NUM" in it, e.g., REAL or INTEGER.
+    The other types, e.g., TEXT, DATETIME or none, are for the local date-time texts.
+
+    Args:
+        con: A connection to the database.
+        db_path: A path of database file. If given, the result is cached with the
+          connection of the pool, hence con should be the connection of the pool.
+        table: A name of table.
+    """
+    cache = {} if db_path is None else pool.cache(db_path)
+    key = (table, "epoch")
+    if key not in cache:
+        columns = con.execute(f"PRAGMA table_info({table})").fetchall()
+        declared = columns[1][2].upper() if len(columns) > 1 else ""
+        cache[key] = any(name in declared for name in ("INT", "REAL", "FLOA", "DOUB", "NUM"))
+    return cache[key]
+
+
+def _ensure_index(con: sqlite3.Connection, table: str, column: str):
+    """Creates an index on the column of the table if there is no index starting with it.
+
+    The failure is logged and ignored, e.g., for a read-only database,
+      since the index only makes the range queries faster.
+
+    Args:
+        con: A connection to the database.
+        table: A name of table.
+        column: A name of column.
+    """
+    for index in con.execute(f"PRAGMA index_list({table})").fetchall():
+        info = con.execute(f"PRAGMA index_info({index[1]})").fetchall()
+        if info and min(info)[2] == column:
+            return
+    try:
+        with con:
+            con.execute(f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})")
+    except sqlite3.Error:
+        logger.warning("Failed to create an index on %s of table %s", column, table,
+                       exc_info=True)
+
+
+def _local_text(epoch: float) -> str:
+    """Returns the local date-time text of the epoch time, e.g., "2023-01-01 12:34:56".
+
+    Args:
+        epoch: The epoch time in seconds.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(epoch))
@@ -0,0 +1,177 @@
+"""
+Benchmark of concurrent readers and writers on a database through the backend module.
+
+Each writer thread writes values and each reader thread reads the last value
+  as fast as possible, on the same database file, for the given duration.
+It reports the throughput, the failures and the latencies of each role.
+
+Usage:
+    python -m examples.backend_benchmark --writers 2 --readers 4 --journal-mode DELETE
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from examples import backend
+
+
+class RoleStats:  # pylint: disable=too-few-public-methods
+    """Statistics of the threads of a role, i.e., writers or readers.
+
+    Attributes:
+        latencies: The latencies in seconds of the successful operations.
+        failures: The number of the failed operations.
+    """
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def add(self, latencies: List[float], failures: int):
+        """Adds the results of a thread.
+
+        Args:
+            latencies: See the attributes section.
+            failures: See the attributes section.
+        """
+        with self._lock:
+            self.latencies.extend(latencies)
+            self.failures += failures
+
+    def report(self, name: str, duration: float) -> str:
+        """Returns a line of the report.
+
+        Args:
+            name: The name of the role.
+            duration: The duration of the benchmark in seconds.
+        """
+        if not self.latencies:
+            return f"{name:>8}: no successful operation, {self.failures} failures"
+        quantiles = statistics.quantiles(self.latencies, n=100)
+        return (f"{name:>8}: {len(self.latencies) / duration:10.1f} ops/s, "
+                f"{self.failures} failures, "
+                f"p50 {quantiles[49] * 1e3:.3f} ms, p99 {quantiles[98] * 1e3:.3f} ms, "
+                f"max {max(self.latencies) * 1e3:.3f} ms")
+
+
+def _work(
+    isWriter: bool,
+    db_path: str,
+    table: str,
+    deadline: float,
+    stats: RoleStats,
+    buffer: Optional[backend.WriteBehindBuffer],
+):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    """Writes or reads the database repeatedly until the deadline.
+
+    Args:
+        isWriter: True for a writer, and False for a reader.
+        db_path: A path of database file.
+        table: A name of table.
+        deadline: The time.monotonic() value when it stops.
+        stats: The statistics of the role.
+        buffer: The buffer for the writers. See backend.write().
+    """
+    latencies, failures = [], 0
+    value = 0
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        if isWriter:
+            isSuccessful = backend.write(db_path, table, value, buffer)
+            value += 1
+        else:
+            isSuccessful = backend.read(db_path, table) is not None
+        if isSuccessful:
+            latencies.append(time.perf_counter() - start)
+        else:
+            failures += 1
+    backend.pool.close()
+    stats.add(latencies, failures)
+
+
+def run(
+    db_path: str,
+    writers: int,
+    readers: int,
+    duration: float,
+    buffer: Optional[backend.WriteBehindBuffer] = None,
+) -> Dict[str, RoleStats]:
+    """Runs the benchmark and returns the statistics of the writers and the readers.
+
+    Args:
+        db_path: A path of database file. It should not have the table "benchmark".
+        writers: The number of the writer threads.
+        readers: The number of the reader threads.
+        duration: The duration in seconds.
+        buffer: See _work().
+    """
+    table = "benchmark"
+    backend.create_table(db_path, table)
+    backend.write(db_path, table, 0)
+    stats = {"writers": RoleStats(), "readers": RoleStats()}
+    deadline = time.monotonic() + duration
+    threads = [
+        threading.Thread(target=_work, args=(isWriter, db_path, table, deadline, stats[role],
+                                             buffer))
+        for isWriter, role, count in ((True, "writers", writers), (False, "readers", readers))
+        for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if buffer is not None:
+        buffer.flush()
+    return stats
+
+
+def _get_argparser() -> argparse.ArgumentParser:
+    """Parses command line arguments.
+
+    -w, --writers: The number of the writer threads.
+    -r, --readers: The number of the reader threads.
+    -d, --duration: The duration in seconds.
+    -j, --journal-mode: The journal mode of the database. See backend.ConnectionPool.
+    -b, --buffered: Writes through a backend.WriteBehindBuffer.
+
+    Returns:
+        A namespace object including the arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark of concurrent readers and writers of the backend module"
+    )
+    parser.add_argument("-w", "--writers", type=int, default=2)
+    parser.add_argument("-r", "--readers", type=int, default=4)
+    parser.add_argument("-d", "--duration", type=float, default=5)
+    parser.add_argument("-j", "--journal-mode", default="WAL")
+    parser.add_argument("-b", "--buffered", action="store_true")
+    return parser
+
+
+def main():
+    """Main function that runs the benchmark on a temporary database."""
+    args = _get_argparser().parse_args()
+    # the failures are counted instead
+    logging.getLogger(backend.__name__).setLevel(logging.CRITICAL)
+    backend.pool.journalMode = args.journal_mode
+    buffer = backend.WriteBehindBuffer() if args.buffered else None
+    with tempfile.TemporaryDirectory() as dir_path:
+        stats = run(os.path.join(dir_path, "benchmark.db"),
+                    args.writers, args.readers, args.duration, buffer)
+        if buffer is not None:
+            buffer.close()
+    print(f"journal mode {args.journal_mode}, {args.writers} writers, {args.readers} readers"
+          f"{', buffered' if args.buffered else ''}, {args.duration} s")
+    for role, roleStats in stats.items():
+        print(roleStats.report(role, args.duration))
+
+
+if __name__ == "__main__":
+    main()
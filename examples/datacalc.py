@@ -4,7 +4,6 @@ App module for showing the sum of two values from selected databases.
 
 import os
 import json
-import logging
 import functools
 from typing import Any, Optional, Dict, Tuple
 
@@ -13,8 +12,7 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QComboBox, QPushButton, QLabel
 
 from qiwis import BaseApp
 from examples.backend import read
-
-logger = logging.getLogger(__name__)
+from examples.asyncbackend import AsyncBackend
 
 
 class ViewerFrame(QWidget):
@@ -60,6 +58,7 @@ class DataCalcApp(BaseApp):
           A key is a file name and its value is an absolute path.
         dbNames: A dictionary for storing names of the selected databases.
         viewerFrame: A frame that selects databases and shows the calculated number.
+        backend: An AsyncBackend for fetching the values off the GUI thread.
     """
     def __init__(self, name: str, tables: Dict[str, str], parent: Optional[QObject] = None):
         """Extended.
@@ -72,6 +71,7 @@ class DataCalcApp(BaseApp):
         self.dbs = {"": ""}
         self.dbNames = {"A": "", "B": ""}
         self.viewerFrame = ViewerFrame()
+        self.backend = AsyncBackend(self)
         for dbBox in self.viewerFrame.dbBoxes.values():
             dbBox.addItem("")
         # connect signals to slots
@@ -98,8 +98,8 @@ class DataCalcApp(BaseApp):
         newDBs = set([""])
         for db in content.get("db", ()):
             if any(key not in db for key in ("name", "path")):
-                logger.error("The message was ignored because "
-                             "the database %s has no such key; name or path.", json.dumps(db))
+                self.logger.error("The message was ignored because "
+                                  "the database %s has no such key; name or path.", json.dumps(db))
                 continue
             name, path = db["name"], db["path"]
             newDBs.add(name)
@@ -128,10 +128,10 @@ class DataCalcApp(BaseApp):
             if isinstance(content, dict):
                 self.updateDB(content)
             else:
-                logger.error("The message for the channel db should be a dictionary.")
+                self.logger.error("The message for the channel db should be a dictionary.")
         else:
-            logger.error("The message was ignored because "
-                         "the treatment for the channel %s is not implemented.", channelName)
+            self.logger.error("The message was ignored because "
+                              "the treatment for the channel %s is not implemented.", channelName)
 
     @pyqtSlot(str)
     def setDB(self, name: str):
@@ -143,18 +143,34 @@ class DataCalcApp(BaseApp):
         dbBox = self.viewerFrame.dbBoxes[name]
         self.dbNames[name] = dbBox.currentText()
         if self.dbNames[name]:
-            logger.info("Database %s is set as %s.", name, self.dbNames[name])
+            self.logger.info("Database %s is set as %s.", name, self.dbNames[name])
         else:
-            logger.info("Database %s is not selected.", name)
+            self.logger.info("Database %s is not selected.", name)
 
     @pyqtSlot()
     def calculateSum(self):
-        """Calculates and shows the sum of two values when the button is clicked."""
+        """Fetches the two values when the button is clicked.
+
+        The sum is shown by showSum() after both values are fetched.
+        """
+        sources = {
+            name: (os.path.join(self.dbs[dbName], dbName), self.tables[name])
+            for name, dbName in self.dbNames.items()
+        }
+        self.viewerFrame.numberLabel.setText("fetching numbers")
+        self.backend.submit(read_values, sources, callback=self.showSum)
+
+    def showSum(self, values: Optional[Dict[str, Any]]):
+        """Calculates and shows the sum of the fetched values.
+
+        Args:
+            values: See read_values(). None if fetching the values failed.
+        """
+        if values is None:
+            self.viewerFrame.numberLabel.setText("failed to fetch numbers")
+            return
         result = 0
-        for name, dbName in self.dbNames.items():
-            dbPath = self.dbs[dbName]
-            table = self.tables[name]
-            value = read(os.path.join(dbPath, dbName), table)
+        for name, value in values.items():
             if value is None:
                 self.viewerFrame.numberLabel.setText(f"failed to fetch number from {name}")
                 break
@@ -165,4 +181,20 @@ class DataCalcApp(BaseApp):
             result += value
         else:
             self.viewerFrame.numberLabel.setText(f"sum: {result}")
-            logger.info("Sum: %f.", result)
+            self.logger.info("Sum: %f.", result)
+
+
+def read_values(sources: Dict[str, Tuple[str, str]]) -> Dict[str, Any]:
+    """Reads the values from the databases.
+
+    It is called on the worker thread of AsyncBackend.
+
+    Args:
+        sources: A dictionary whose keys are "A" and "B" and values are
+          (database path, table name) tuples.
+
+    Returns:
+        A dictionary whose keys are the same as sources and values are the read values.
+        See backend.read().
+    """
+    return {name: read(db_path, table) for name, (db_path, table) in sources.items()}
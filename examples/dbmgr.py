@@ -3,18 +3,15 @@ App module for adding and removing available databases.
 """
 
 import os
-import logging
 from collections import namedtuple
 from typing import Optional, Tuple
 
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, QTimer, pyqtSlot
 from PyQt5.QtWidgets import (QWidget, QLabel, QPushButton, QFileDialog,
                              QHBoxLayout, QVBoxLayout, QListWidget, QListWidgetItem)
 
 from qiwis import AppInfo, BaseApp
 
-logger = logging.getLogger(__name__)
-
 
 class DBWidget(QWidget):
     """Widget for showing a database.
@@ -90,6 +87,9 @@ class DBMgrApp(BaseApp):
           name: A file name of the database.
           path: An absolute path of the database.
 
+        The initial database list is broadcast once the app starts,
+          and then the app notifies that it is ready.
+
     Attributes:
         dbList: A list for storing available databases.
           Each element is a namedtuple which represents a database.
@@ -101,6 +101,8 @@ class DBMgrApp(BaseApp):
     """
     DB = namedtuple("DB", ["path", "name"])
 
+    deferReady = True
+
     def __init__(self, name: str, parent: Optional[QObject] = None):
         """Extended."""
         super().__init__(name, parent=parent)
@@ -111,6 +113,8 @@ class DBMgrApp(BaseApp):
         # connect signals to slots
         self.managerFrame.addButton.clicked.connect(self.addDB)
         self.managerFrame.openCloseDatacalcButton.clicked.connect(self.openCloseDatacalc)
+        # publish the initial state after the app is connected to qiwis
+        QTimer.singleShot(0, self.publishDB)
 
     def frames(self) -> Tuple[Tuple[str, ManagerFrame]]:
         """Overridden."""
@@ -125,7 +129,13 @@ class DBMgrApp(BaseApp):
         """
         msg = {"db": [db._asdict() for db in self.dbList]}
         self.broadcast("db", msg)
-        logger.info("Database %s is %s.", name, "added" if isAdded else "removed")
+        self.logger.info("Database %s is %s.", name, "added" if isAdded else "removed")
+
+    @pyqtSlot()
+    def publishDB(self):
+        """Broadcasts the initial database list and notifies that the app is ready."""
+        self.broadcast("db", {"db": [db._asdict() for db in self.dbList]})
+        self.notifyReady()
 
     @pyqtSlot()
     def addDB(self):
@@ -181,7 +191,9 @@ class DBMgrApp(BaseApp):
         """
         if self.openCloseDatacalcResult is not None:
             if not self.openCloseDatacalcResult.done:
-                logger.warning("DBMgrApp.openCloseDatacalc(): The previous qiwiscall must be done.")
+                self.logger.warning(
+                    "DBMgrApp.openCloseDatacalc(): The previous qiwiscall must be done."
+                )
                 return
             if self.openCloseDatacalcResult.success:
                 self.isDatacalcOpen = not self.isDatacalcOpen
@@ -195,6 +207,7 @@ class DBMgrApp(BaseApp):
                     cls="DataCalcApp",
                     pos="center",
                     channel=["db"],
+                    pooled=True,
                     args={
                         "tables": {
                             "A": "number",
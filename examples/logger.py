@@ -1,80 +1,185 @@
 """App module for logging."""
 
+import functools
 import logging
-from typing import Any, Optional, Tuple, Callable
+import queue
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable
 
-from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal, QDateTime
+from PyQt5.QtCore import (
+    QObject, pyqtSlot, pyqtSignal, QTimer, Qt, QAbstractTableModel, QModelIndex, QDateTime
+)
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QTextEdit, QLabel, QDialogButtonBox, QComboBox
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QPlainTextEdit, QLabel, QDialogButtonBox,
+    QComboBox, QLineEdit, QDateTimeEdit, QTableView, QHeaderView
 )
 
 from qiwis import BaseApp
+from examples.logstore import LogStore, LogStoreHandler, LogRow
 
-logger = logging.getLogger(__name__)
+LEVEL_NAMES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 
 
 class _Signaller(QObject):
     """Signal only for LoggingHandler.
 
     Signals:
-        signal(log): A formatted log message is emitted. 
+        signal(): Log records are queued after the queue is drained.
     """
 
-    signal = pyqtSignal(str)
+    signal = pyqtSignal()
 
 
 class LoggingHandler(logging.Handler):
     """Handler for logger.
 
-    Sends a log message to the connected function through a signal. 
+    Puts log records into a queue from any thread, and notifies the connected function
+    through a signal only once until the queue is drained. The records are drained
+    in batches on the thread of the connected function, and they are not formatted
+    by the handler. Therefore, the arguments of a record should not be modified
+    after logging it.
 
     Attributes:
-        signaller: A _Signaller class contains signal for emitting log.
+        queue: A queue of the log records which are not drained yet.
+        signaller: A _Signaller class contains signal for notifying the queued records.
     """
 
-    def __init__(self, slotfunc: Callable[[str], Any]):
+    def __init__(self, slotfunc: Callable[[], Any]):
         """Extended.
 
-        Connects the slotfunc to the signal.
+        Connects the slotfunc to the signal with a queued connection.
 
         Args:
-            slotfunc: A slot function which is called when a log record is emitted.
+            slotfunc: A slot function which is called when log records are queued.
+              It should call drain() to take the records out.
         """
         super().__init__()
+        self.queue = queue.SimpleQueue()
+        self._isNotified = False
         self.signaller = _Signaller()
-        self.signaller.signal.connect(slotfunc)
+        self.signaller.signal.connect(slotfunc, type=Qt.QueuedConnection)
 
     def emit(self, record: logging.LogRecord):
         """Overridden.
         
-        Emits input signal to the connected function.
+        Puts the record into the queue and notifies if it is not notified yet.
+        It is called with the handler lock acquired.
         """
-        logMsg = self.format(record)
-        self.signaller.signal.emit(logMsg)
+        self.queue.put(record)
+        if not self._isNotified:
+            self._isNotified = True
+            self.signaller.signal.emit()
+
+    def drain(self) -> List[logging.LogRecord]:
+        """Takes all the queued records out of the queue and returns them."""
+        self.acquire()
+        try:
+            self._isNotified = False
+        finally:
+            self.release()
+        records = []
+        while True:
+            try:
+                records.append(self.queue.get_nowait())
+            except queue.Empty:
+                return records
+
+
+class LevelFilter(logging.Filter):
+    """Filter for the minimum levels of log records by logger names and apps.
+
+    The minimum level of a record is the level of its app if it is set.
+    Otherwise, it is the level of the longest logger name which is the name of
+    the record's logger or its ancestor. Otherwise, it is the default level.
+
+    Attributes:
+        defaultLevel: The minimum level of the records which have no specific level.
+        nameLevels: A dictionary whose keys are logger names and values are levels.
+          The level of a logger name also applies to its descendants.
+        appLevels: A dictionary whose keys are app names and values are levels.
+          It applies to the records which have the app attribute, e.g., the ones logged
+          by BaseApp.logger.
+    """
 
+    def __init__(self, defaultLevel: int = logging.WARNING):
+        """Extended.
+
+        Args:
+            See the attributes section.
+        """
+        super().__init__()
+        self.defaultLevel = defaultLevel
+        self.nameLevels: Dict[str, int] = {}
+        self.appLevels: Dict[str, int] = {}
+
+    def nameLevel(self, name: str) -> int:
+        """Returns the minimum level of the records of the logger.
+
+        Args:
+            name: The logger name.
+        """
+        while name:
+            if name in self.nameLevels:
+                return self.nameLevels[name]
+            name = name.rpartition(".")[0]
+        return self.defaultLevel
 
-class LoggerFrame(QWidget):
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Overridden."""
+        level = self.appLevels.get(getattr(record, "app", None))
+        if level is None:
+            level = self.nameLevel(record.name)
+        return record.levelno >= level
+
+
+class LoggerFrame(QWidget):  # pylint: disable=too-many-instance-attributes
     """Frame for logging.
 
     Attributes:
-        logEdit: A textEdit which shows all logs.
+        logEdit: A plainTextEdit which shows the recent logs.
         clearButton: A button for clearing all logs.
-        levelBox: A comboBox for setting the logger's level.
+        levelBox: A comboBox for setting the default level.
+        filterKindBox: A comboBox for selecting whether filterEdit is a logger name or an app.
+        filterEdit: A lineEdit for the logger name or the app name to set the level.
+        filterLevelBox: A comboBox for the level of filterEdit. "DEFAULT" removes the level.
+        filterButton: A button for setting the level of filterEdit.
+        filterLabel: A label which shows the levels set by filterButton.
     """
 
-    def __init__(self, parent: Optional[QObject] = None):
-        """Extended."""
+    def __init__(self, maxLines: int = 10000, parent: Optional[QObject] = None):
+        """Extended.
+
+        Args:
+            maxLines: The maximum number of lines in logEdit.
+              The oldest lines are removed when it is exceeded.
+        """
         super().__init__(parent=parent)
         # widgets
-        self.logEdit = QTextEdit(self)
+        self.logEdit = QPlainTextEdit(self)
         self.logEdit.setReadOnly(True)
+        self.logEdit.setMaximumBlockCount(maxLines)
         self.clearButton = QPushButton("Clear", self)
         self.levelBox = QComboBox(self)
+        self.filterKindBox = QComboBox(self)
+        self.filterKindBox.addItems(("Logger", "App"))
+        self.filterEdit = QLineEdit(self)
+        self.filterEdit.setPlaceholderText("Logger name or app name")
+        self.filterLevelBox = QComboBox(self)
+        self.filterLevelBox.addItems(LEVEL_NAMES + ("DEFAULT",))
+        self.filterButton = QPushButton("Set level", self)
+        self.filterLabel = QLabel(self)
+        self.filterLabel.setWordWrap(True)
         # layout
+        filterLayout = QHBoxLayout()
+        filterLayout.addWidget(self.filterKindBox)
+        filterLayout.addWidget(self.filterEdit)
+        filterLayout.addWidget(self.filterLevelBox)
+        filterLayout.addWidget(self.filterButton)
         layout = QVBoxLayout(self)
         layout.addWidget(self.logEdit)
         layout.addWidget(self.clearButton)
         layout.addWidget(self.levelBox)
+        layout.addLayout(filterLayout)
+        layout.addWidget(self.filterLabel)
 
 
 class ConfirmClearingFrame(QWidget):
@@ -116,79 +221,388 @@ class ConfirmClearingFrame(QWidget):
         self.close()
 
 
-class LoggerApp(BaseApp):
+class LogQueryModel(QAbstractTableModel):
+    """Table model of the records in a LogStore which satisfy the search conditions.
+
+    The records are fetched lazily by pages, newest first, as the view scrolls down.
+    """
+
+    headers = ("Time", "Level", "Name", "App", "Message")
+
+    def __init__(self, store: LogStore, pageSize: int = 200, parent: Optional[QObject] = None):
+        """Extended.
+
+        Args:
+            store: The log store to search.
+            pageSize: The number of the records fetched at once.
+        """
+        super().__init__(parent=parent)
+        self.store = store
+        self.pageSize = pageSize
+        self._conditions: Dict[str, Any] = {}
+        self._rows: List[LogRow] = []
+        self._hasMore = False
+
+    def search(self, **conditions: Any):
+        """Resets the model with the new search conditions.
+
+        Args:
+            **conditions: The keyword arguments for LogStore.query() except paging.
+        """
+        self.beginResetModel()
+        self._conditions = conditions
+        self._rows = []
+        self._hasMore = True
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Overridden."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Overridden."""
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Overridden."""
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        _, created, level, name, app, message = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return QDateTime.fromMSecsSinceEpoch(round(created * 1000)).toString(
+                "yyyy-MM-dd hh:mm:ss.zzz"
+            )
+        if column == 1:
+            return logging.getLevelName(level)
+        if column == 2:
+            return name
+        if column == 3:
+            return app
+        return message
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> Any:
+        """Overridden."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Overridden."""
+        return not parent.isValid() and self._hasMore
+
+    def fetchMore(self, parent: QModelIndex):
+        """Overridden.
+
+        Fetches the next page, older than the last fetched record.
+        """
+        if parent.isValid():
+            return
+        beforeId = self._rows[-1][0] if self._rows else None
+        rows = self.store.query(**self._conditions, beforeId=beforeId, limit=self.pageSize)
+        self._hasMore = len(rows) == self.pageSize
+        if rows:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+
+class LogSearchFrame(QWidget):  # pylint: disable=too-many-instance-attributes
+    """Frame for searching the stored logs.
+
+    The minimum date-times of startEdit and endEdit mean no bound.
+
+    Attributes:
+        textEdit: A lineEdit for the text contained in the messages.
+        levelBox: A comboBox for the minimum level.
+        nameEdit: A lineEdit for the logger name, including its descendants.
+        appEdit: A lineEdit for the app name.
+        startEdit: A dateTimeEdit for the start time.
+        endEdit: A dateTimeEdit for the end time.
+        searchButton: A button for searching with the above conditions.
+        tableView: A tableView which shows the found records.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """Extended."""
+        super().__init__(parent=parent)
+        # widgets
+        self.textEdit = QLineEdit(self)
+        self.textEdit.setPlaceholderText("Message text")
+        self.levelBox = QComboBox(self)
+        self.levelBox.addItems(LEVEL_NAMES)
+        self.nameEdit = QLineEdit(self)
+        self.nameEdit.setPlaceholderText("Logger name")
+        self.appEdit = QLineEdit(self)
+        self.appEdit.setPlaceholderText("App name")
+        self.startEdit = self._dateTimeEdit()
+        self.endEdit = self._dateTimeEdit()
+        self.searchButton = QPushButton("Search", self)
+        self.tableView = QTableView(self)
+        self.tableView.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tableView.horizontalHeader().setStretchLastSection(True)
+        self.tableView.verticalHeader().hide()
+        # connect signals
+        self.textEdit.returnPressed.connect(self.searchButton.click)
+        # layout
+        queryLayout = QHBoxLayout()
+        for widget in (self.textEdit, self.levelBox, self.nameEdit, self.appEdit,
+                       self.startEdit, self.endEdit, self.searchButton):
+            queryLayout.addWidget(widget)
+        layout = QVBoxLayout(self)
+        layout.addLayout(queryLayout)
+        layout.addWidget(self.tableView)
+
+    def _dateTimeEdit(self) -> QDateTimeEdit:
+        """Returns a dateTimeEdit whose minimum date-time is shown as "any"."""
+        edit = QDateTimeEdit(self)
+        edit.setCalendarPopup(True)
+        edit.setDisplayFormat("yyyy-MM-dd hh:mm:ss")
+        edit.setSpecialValueText("any")
+        edit.setDateTime(edit.minimumDateTime())
+        return edit
+
+    def conditions(self) -> Dict[str, Any]:
+        """Returns the search conditions as the keyword arguments for LogStore.query()."""
+        conditions = {
+            "level": logging.getLevelName(self.levelBox.currentText()),
+            "name": self.nameEdit.text().strip(),
+            "app": self.appEdit.text().strip(),
+            "text": self.textEdit.text().strip(),
+        }
+        for key, edit in (("start", self.startEdit), ("end", self.endEdit)):
+            if edit.dateTime() != edit.minimumDateTime():
+                conditions[key] = edit.dateTime().toMSecsSinceEpoch() / 1000
+        return conditions
+
+
+class LoggerApp(BaseApp):  # pylint: disable=too-many-instance-attributes
     """App for logging.
 
     Sets a handler of the root logger and manages the loggerFrame to show log messages.
     Gives options to clear logs and select log level in the loggerFrame.
+    The log records are queued by the handler and shown in a batch periodically.
+    The levels can be set for specific loggers and apps, besides the default level,
+    so that seeing the debug records of a part does not enable them everywhere.
+    If a store path is given, the records of the store level or higher are also written
+    into a LogStore through a separate handler, regardless of the levels of the view,
+    and a search frame is provided for searching them.
 
     Attributes:
         loggerFrame: A frame that shows the logs.
         confirmFrame: A frame that asks whether to clear logs.
         handler: A handler for adding logs to the loggerFrame. 
+        levelFilter: A LevelFilter of the handler.
+        flushTimer: A single-shot QTimer for showing the queued log records.
+        store: A LogStore for the log records. None if there is no store path.
+        storeHandler: A LogStoreHandler which puts the log records into the store.
+          None if there is no store path.
+        searchFrame: A LogSearchFrame for the store. None until it is built.
+        searchModel: A LogQueryModel shown in the searchFrame. None until it is built.
     """
 
-    def __init__(self, name: str, parent: Optional[QObject] = None):
-        """Extended."""
+    def __init__(
+        self,
+        name: str,
+        maxLines: int = 10000,
+        flushInterval: int = 100,
+        storePath: Optional[str] = None,
+        storeLevel: str = "INFO",
+        parent: Optional[QObject] = None,
+    ):  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        """Extended.
+
+        Args:
+            maxLines: The maximum number of the log messages shown in the loggerFrame.
+            flushInterval: The interval in ms for showing the queued log records.
+            storePath: The path of the sqlite database file for storing the log records.
+              If None, the records are not stored.
+            storeLevel: The minimum level of the stored records. See setLevel().
+        """
         super().__init__(name, parent=parent)
-        self.loggerFrame = LoggerFrame()
+        rootLogger = logging.getLogger()
+        self.store = None if storePath is None else LogStore(storePath)
+        self.storeHandler: Optional[LogStoreHandler] = None
+        self.searchFrame: Optional[LogSearchFrame] = None
+        self.searchModel: Optional[LogQueryModel] = None
+        if self.store is not None:
+            self.storeHandler = LogStoreHandler(self.store, logging.getLevelName(storeLevel))
+            rootLogger.addHandler(self.storeHandler)
+            self.destroyed.connect(functools.partial(rootLogger.removeHandler, self.storeHandler))
+            self.destroyed.connect(self.store.close)
+        self.loggerFrame = LoggerFrame(maxLines)
+        self.flushTimer = QTimer(self)
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(flushInterval)
+        self.flushTimer.timeout.connect(self.flushLog)
         self.confirmFrame = ConfirmClearingFrame()
         # connect signals to slots
         self.loggerFrame.clearButton.clicked.connect(self.checkToClear)
         self.confirmFrame.confirmed.connect(self.clearLog)
-        self.handler = LoggingHandler(self.addLog)
+        self.handler = LoggingHandler(self.scheduleFlush)
         # TODO(aijuh): Change the log format when it is determined.
-        fs = "%(levelname)s [%(name)s] [%(filename)s:%(lineno)d] %(message)s"
-        formatter = logging.Formatter(fs)
+        fs = "%(asctime)s: %(levelname)s [%(name)s] [%(filename)s:%(lineno)d] %(message)s"
+        formatter = logging.Formatter(fs, "%Y-%m-%d %H:%M:%S")
         self.handler.setFormatter(formatter)
-        rootLogger = logging.getLogger()
+        self.levelFilter = LevelFilter()
+        self.handler.addFilter(self.levelFilter)
         rootLogger.addHandler(self.handler)
         self.setLevel("WARNING")
-        self.loggerFrame.levelBox.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+        self.loggerFrame.levelBox.addItems(LEVEL_NAMES)
         self.loggerFrame.levelBox.textActivated.connect(self.setLevel)
         self.loggerFrame.levelBox.setCurrentText("WARNING")
+        self.loggerFrame.filterButton.clicked.connect(self.setFilterLevel)
 
     @pyqtSlot(str)
     def setLevel(self, levelText: str):
-        """Responds to the loggerFrame's levelBox widget and changes the handler's level.
+        """Responds to the loggerFrame's levelBox widget and changes the default level.
+
+        The default level applies to all the loggers which have no specific level.
 
         Args:
             leveltext: Selected level in the level select box.
               It should be one of "DEBUG", "INFO", "WARNING", "ERROR" and "CRITICAL".
               It should be case-sensitive and any other input is ignored.
         """
-        levels = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL
-        }
-        if levelText in levels:
-            self.handler.setLevel(levels[levelText])
-            logging.getLogger().setLevel(levels[levelText])
+        if levelText in LEVEL_NAMES:
+            level = logging.getLevelName(levelText)
+            self.levelFilter.defaultLevel = level
+            self._updateLoggerLevels()
 
-    def frames(self) -> Tuple[Tuple[str, LoggerFrame]]:
-        """Overridden."""
-        return (("", self.loggerFrame),)
+    def setLoggerLevel(self, name: str, levelText: Optional[str]):
+        """Sets the level of the logger and its descendants, without changing the others.
 
-    @pyqtSlot(str)
-    def addLog(self, content: str):
-        """Adds a received log message to the LoggerFrame.
+        Args:
+            name: The logger name. It should not be empty, i.e., the root logger.
+            levelText: See setLevel(). If None, the specific level is removed and
+              the logger follows its parent.
+        """
+        if levelText is None:
+            self.levelFilter.nameLevels.pop(name, None)
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        elif levelText in LEVEL_NAMES:
+            self.levelFilter.nameLevels[name] = logging.getLevelName(levelText)
+        self._updateLoggerLevels()
+        self._updateFilterLabel()
+
+    def setAppLevel(self, app: str, levelText: Optional[str]):
+        """Sets the level of the records logged by the app through BaseApp.logger.
+
+        The records of the app are shown regardless of the level of its logger.
 
         Args:
-            content: Received log message.
+            app: The app name.
+            levelText: See setLoggerLevel().
+        """
+        if levelText is None:
+            self.levelFilter.appLevels.pop(app, None)
+        elif levelText in LEVEL_NAMES:
+            self.levelFilter.appLevels[app] = logging.getLevelName(levelText)
+        self._updateLoggerLevels()
+        self._updateFilterLabel()
+
+    @pyqtSlot()
+    def setFilterLevel(self):
+        """Sets the level of the logger or the app in the loggerFrame's filter widgets."""
+        target = self.loggerFrame.filterEdit.text().strip()
+        if not target:
+            return
+        levelText = self.loggerFrame.filterLevelBox.currentText()
+        if levelText == "DEFAULT":
+            levelText = None
+        if self.loggerFrame.filterKindBox.currentText() == "App":
+            self.setAppLevel(target, levelText)
+        else:
+            self.setLoggerLevel(target, levelText)
+
+    def _updateLoggerLevels(self):
+        """Sets the levels of the loggers to the lowest level which any record might need.
+
+        The records are filtered by the levelFilter at the handler, and the logger levels
+        only decide which records are created. The logger of an app is not known, hence
+        the levels of the apps and the store level lower all the loggers.
+        """
+        lowest = min(self.levelFilter.appLevels.values(), default=logging.CRITICAL)
+        if self.storeHandler is not None:
+            lowest = min(lowest, self.storeHandler.level)
+        logging.getLogger().setLevel(min(self.levelFilter.defaultLevel, lowest))
+        for name, level in self.levelFilter.nameLevels.items():
+            logging.getLogger(name).setLevel(min(level, lowest))
+
+    def _updateFilterLabel(self):
+        """Shows the specific levels in the loggerFrame's filterLabel."""
+        levels = [
+            f"{name}: {logging.getLevelName(level)}"
+            for name, level in sorted(self.levelFilter.nameLevels.items())
+        ]
+        levels.extend(
+            f"app {app}: {logging.getLevelName(level)}"
+            for app, level in sorted(self.levelFilter.appLevels.items())
+        )
+        self.loggerFrame.filterLabel.setText(", ".join(levels))
+
+    def frames(self) -> Tuple[Tuple[str, Union[QWidget, Callable[[], QWidget]]], ...]:
+        """Overridden.
+
+        The search frame is built lazily when it is shown for the first time.
         """
-        timeString = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-        self.loggerFrame.logEdit.insertPlainText(f"{timeString}: {content}\n")
+        if self.store is None:
+            return (("", self.loggerFrame),)
+        return (("", self.loggerFrame), ("search", self._createSearchFrame))
+
+    def _createSearchFrame(self) -> LogSearchFrame:
+        """Builds and returns the searchFrame with the latest records searched."""
+        self.searchFrame = LogSearchFrame()
+        self.searchModel = LogQueryModel(self.store, parent=self.searchFrame)
+        self.searchFrame.tableView.setModel(self.searchModel)
+        self.searchFrame.searchButton.clicked.connect(self.search)
+        self.search()
+        return self.searchFrame
+
+    @pyqtSlot()
+    def search(self):
+        """Searches the stored records with the conditions in the searchFrame.
+
+        The records which are not written into the store yet are not found.
+        """
+        self.searchModel.search(**self.searchFrame.conditions())
+
+    @pyqtSlot()
+    def scheduleFlush(self):
+        """Schedules flushLog() when log records are queued in the handler."""
+        if not self.flushTimer.isActive():
+            self.flushTimer.start()
+
+    @pyqtSlot()
+    def flushLog(self):
+        """Shows the queued log records in the LoggerFrame at once.
+
+        Only the records which can be shown are formatted.
+        """
+        records = self.handler.drain()
+        contents = []
+        for record in records[-self.loggerFrame.logEdit.maximumBlockCount():]:
+            try:
+                contents.append(self.handler.format(record))
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.handler.handleError(record)
+        if contents:
+            self.loggerFrame.logEdit.appendPlainText("\n".join(contents))
 
     @pyqtSlot()
     def checkToClear(self):
         """Shows a confirmation frame for clearing logs."""
-        logger.info("Tried to clear logs by clicking clear button")
+        self.logger.info("Tried to clear logs by clicking clear button")
         self.confirmFrame.show()
 
     @pyqtSlot()
     def clearLog(self):
-        """Clears the log texts in loggerFrame."""
+        """Clears the log texts in loggerFrame.
+
+        The queued records are not shown. The store, if any, is not affected
+        since it is fed by its own handler.
+        """
+        self.handler.drain()
         self.loggerFrame.logEdit.clear()
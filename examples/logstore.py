@@ -0,0 +1,230 @@
+"""
+Module for storing log records into a sqlite database and searching them.
+"""
+
+import logging
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from typing import Iterable, List, Optional, Tuple
+
+LogRow = Tuple[int, float, int, str, Optional[str], str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS log (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    level INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    app TEXT,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS log_created ON log (created);
+CREATE INDEX IF NOT EXISTS log_level ON log (level, created);
+CREATE INDEX IF NOT EXISTS log_name ON log (name, created);
+CREATE INDEX IF NOT EXISTS log_app ON log (app, created);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS log_fts USING fts5(
+    message, content='log', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS log_fts_insert AFTER INSERT ON log BEGIN
+    INSERT INTO log_fts (rowid, message) VALUES (new.id, new.message);
+END;
+"""
+
+
+class LogStore:  # pylint: disable=too-many-instance-attributes
+    """Log store which writes log records into a sqlite database in batches.
+
+    The records are written by a worker thread, so put() does not block for the database.
+    A batch is written when it has batchSize records or flushInterval seconds have passed
+    since its first record is put.
+
+    Attributes:
+        path: The path of the database file.
+        batchSize: The maximum number of records written in a transaction.
+        flushInterval: The maximum time in seconds for a record to wait for its batch.
+        hasFts: Whether the full-text search on the messages is available.
+          It is False if the sqlite library does not support FTS5.
+    """
+
+    def __init__(self, path: str, batchSize: int = 500, flushInterval: float = 1.):
+        """
+        Args:
+            See the attributes section.
+        """
+        self.path = path
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self._formatter = logging.Formatter()
+        self._queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue()
+        self._readConnection: Optional[sqlite3.Connection] = None
+        with sqlite3.connect(path) as connection:
+            connection.executescript(_SCHEMA)
+            try:
+                connection.executescript(_FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                self.hasFts = False
+            else:
+                self.hasFts = True
+        connection.close()
+        self._thread = threading.Thread(target=self._run, name="LogStore", daemon=True)
+        self._thread.start()
+
+    def put(self, records: Iterable[logging.LogRecord]):
+        """Puts the records to be written.
+
+        Args:
+            records: The log records to write. Their messages are formatted by the worker.
+        """
+        for record in records:
+            self._queue.put(record)
+
+    def close(self):
+        """Writes the remaining records and stops the worker thread."""
+        self._queue.put(None)
+        self._thread.join()
+        if self._readConnection is not None:
+            self._readConnection.close()
+            self._readConnection = None
+
+    def _row(self, record: logging.LogRecord) -> Tuple[float, int, str, Optional[str], str]:
+        """Returns the row values of the record except the id.
+
+        Args:
+            record: The log record to convert.
+        """
+        message = record.getMessage()
+        if record.exc_info:
+            message = f"{message}\n{self._formatter.formatException(record.exc_info)}"
+        return (record.created, record.levelno, record.name, getattr(record, "app", None), message)
+
+    def _run(self):
+        """Writes the put records in batches until close() is called."""
+        connection = sqlite3.connect(self.path)
+        isClosing = False
+        while not isClosing:
+            record = self._queue.get()
+            if record is None:
+                break
+            batch = [record]
+            deadline = time.monotonic() + self.flushInterval
+            while len(batch) < self.batchSize:
+                try:
+                    record = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if record is None:
+                    isClosing = True
+                    break
+                batch.append(record)
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO log (created, level, name, app, message) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        map(self._row, batch),
+                    )
+            except Exception:  # pylint: disable=broad-exception-caught
+                # it must not log with the logging module, which leads to a loop
+                print(f"LogStore: Failed to write {len(batch)} log records into {self.path}",
+                      file=sys.stderr)
+                traceback.print_exc(file=sys.stderr)
+        connection.close()
+
+    def query(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        level: int = logging.NOTSET,
+        name: str = "",
+        app: str = "",
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        text: str = "",
+        beforeId: Optional[int] = None,
+        limit: int = 100,
+    ) -> List[LogRow]:
+        """Returns the stored records which satisfy all the given conditions, newest first.
+
+        It should be called in the same thread, since it keeps a connection for reading.
+
+        Args:
+            level: The minimum level of the records.
+            name: The logger name. The records of its descendant loggers are also returned.
+              An empty string for all the loggers.
+            app: The name of the app which logged the records. An empty string for all.
+            start: If given, only the records created at or after this timestamp are returned.
+            end: If given, only the records created before this timestamp are returned.
+            text: The text which should be contained in the message. An empty string for all.
+              With the full-text search, it matches the words in the message, and its last word
+              may be a prefix of a word, e.g., "connection fail" matches "connection failed" but
+              "conn failed" does not.
+            beforeId: If given, only the records whose id is less than this are returned.
+              It is used for paging, with the id of the last record of the previous page.
+            limit: The maximum number of the returned records.
+
+        Returns:
+            A list of (id, created, level, name, app, message) tuples.
+        """
+        conditions, parameters = ["level >= ?"], [level]
+        if name:
+            conditions.append("(name = ? OR substr(name, 1, ?) = ?)")
+            parameters.extend((name, len(name) + 1, f"{name}."))
+        if app:
+            conditions.append("app = ?")
+            parameters.append(app)
+        if start is not None:
+            conditions.append("created >= ?")
+            parameters.append(start)
+        if end is not None:
+            conditions.append("created < ?")
+            parameters.append(end)
+        if text:
+            if self.hasFts:
+                conditions.append("id IN (SELECT rowid FROM log_fts WHERE log_fts MATCH ?)")
+                phrase = text.replace('"', '""')
+                parameters.append(f'"{phrase}"*')
+            else:
+                conditions.append("instr(message, ?) > 0")
+                parameters.append(text)
+        if beforeId is not None:
+            conditions.append("id < ?")
+            parameters.append(beforeId)
+        parameters.append(limit)
+        if self._readConnection is None:
+            self._readConnection = sqlite3.connect(self.path)
+        return self._readConnection.execute(
+            "SELECT id, created, level, name, app, message FROM log "
+            f"WHERE {' AND '.join(conditions)} ORDER BY id DESC LIMIT ?",
+            parameters,
+        ).fetchall()
+
+
+class LogStoreHandler(logging.Handler):
+    """Handler which puts log records into a LogStore.
+
+    The records are formatted by the worker thread of the store. Therefore, the arguments
+    of a record should not be modified after logging it.
+
+    Attributes:
+        store: The log store which the records are put into.
+    """
+
+    def __init__(self, store: LogStore, level: int = logging.NOTSET):
+        """Extended.
+
+        Args:
+            store: See the attributes section.
+            level: The minimum level of the records to store.
+        """
+        super().__init__(level)
+        self.store = store
+
+    def emit(self, record: logging.LogRecord):
+        """Overridden."""
+        self.store.put((record,))
@@ -4,16 +4,14 @@ App module for generating and showing a random number.
 
 import os
 import json
-import logging
 from typing import Any, Optional, Tuple, Union
 
 from PyQt5.QtCore import QObject, pyqtSlot
 from PyQt5.QtWidgets import QWidget, QComboBox, QPushButton, QLabel, QVBoxLayout
 
 from qiwis import BaseApp
-from examples.backend import generate, write
-
-logger = logging.getLogger(__name__)
+from examples.backend import generate
+from examples.asyncbackend import AsyncBackend
 
 
 class GeneratorFrame(QWidget):
@@ -70,6 +68,7 @@ class NumGenApp(BaseApp):
         dbName: A name of the selected database.
         generatorFrame: A frame that requests generating a random number.
         viewerFrame: A frame that shows the generated number.
+        backend: An AsyncBackend for saving the generated numbers off the GUI thread.
     """
     def __init__(self, name: str, table: str = "number", parent: Optional[QObject] = None):
         """Extended.
@@ -82,6 +81,7 @@ class NumGenApp(BaseApp):
         self.dbs = {"": ""}
         self.dbName = ""
         self.isGenerated = False
+        self.backend = AsyncBackend(self)
         self.generatorFrame = GeneratorFrame()
         self.generatorFrame.dbBox.addItem("")
         self.viewerFrame = ViewerFrame()
@@ -114,8 +114,8 @@ class NumGenApp(BaseApp):
         newDBs = set([""])
         for db in content.get("db", ()):
             if any(key not in db for key in ("name", "path")):
-                logger.error("The message was ignored because "
-                             "the database %s has no such key; name or path.", json.dumps(db))
+                self.logger.error("The message was ignored because "
+                                  "the database %s has no such key; name or path.", json.dumps(db))
                 continue
             name, path = db["name"], db["path"]
             newDBs.add(name)
@@ -141,10 +141,10 @@ class NumGenApp(BaseApp):
             if isinstance(content, dict):
                 self.updateDB(content)
             else:
-                logger.error("The message for the channel db should be a dictionary.")
+                self.logger.error("The message for the channel db should be a dictionary.")
         else:
-            logger.error("The message was ignored because "
-                         "the treatment for the channel %s is not implemented.", channelName)
+            self.logger.error("The message was ignored because "
+                              "the treatment for the channel %s is not implemented.", channelName)
 
     @pyqtSlot()
     def setDB(self):
@@ -152,9 +152,9 @@ class NumGenApp(BaseApp):
         self.dbName = self.generatorFrame.dbBox.currentText()
         self.viewerFrame.statusLabel.setText("database updated")
         if self.dbName:
-            logger.info("Database to store is set as %s", self.dbName)
+            self.logger.info("Database to store is set as %s", self.dbName)
         else:
-            logger.info("Database to store is not selected.")
+            self.logger.info("Database to store is not selected.")
 
     @pyqtSlot()
     def generateNumber(self):
@@ -165,13 +165,21 @@ class NumGenApp(BaseApp):
             self.isGenerated = True
             self.qiwiscall.updateFrames(name=self.name)
         self.viewerFrame.numberLabel.setText(f"generated number: {num}")
-        logger.info("Generated number: %d.", num)
+        self.logger.info("Generated number: %d.", num)
         # save the generated number
         dbPath = self.dbs[self.dbName]
-        is_save_success = write(os.path.join(dbPath, self.dbName), self.table, num)
-        if is_save_success:
+        self.viewerFrame.statusLabel.setText("saving number")
+        self.backend.write(os.path.join(dbPath, self.dbName), self.table, num, self.numberSaved)
+
+    def numberSaved(self, isSaved: Optional[bool]):
+        """Called when saving the generated number is done.
+
+        Args:
+            isSaved: Whether the generated number is saved. See AsyncBackend.write().
+        """
+        if isSaved:
             self.viewerFrame.statusLabel.setText("number saved successfully")
-            logger.info("Generated number saved.")
+            self.logger.info("Generated number saved.")
         else:
             self.viewerFrame.statusLabel.setText("failed to save number")
-            logger.error("Failed to save generated number.")
+            self.logger.error("Failed to save generated number.")
@@ -4,16 +4,15 @@ App module for polling a number and saving it into the selected database.
 
 import os
 import json
-import logging
-from typing import Any, Optional, Tuple
+import functools
+from typing import Any, Dict, List, Optional, Tuple
 
 from PyQt5.QtCore import QObject, pyqtSlot, QTimer
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QComboBox, QSpinBox, QLabel
 
 from qiwis import BaseApp
-from examples.backend import poll, write
-
-logger = logging.getLogger(__name__)
+from examples.backend import WriteBehindBuffer, poll
+from examples.asyncbackend import AsyncBackend
 
 
 class ViewerFrame(QWidget):
@@ -44,7 +43,7 @@ class ViewerFrame(QWidget):
         layout.addWidget(self.numberLabel)
 
 
-class PollerApp(BaseApp):
+class PollerApp(BaseApp):  # pylint: disable=too-many-instance-attributes
     """App for polling a number and saving it into the selected database.
 
     Manage a viewer frame.
@@ -59,15 +58,32 @@ class PollerApp(BaseApp):
         viewerFrame: A frame that selects a database and period, and shows the polled number.
         count: The polled count. It starts from 0.
         timer: A QTimer object for polling. The initial interval is a second.
+        writeBuffer: A WriteBehindBuffer for saving the polled numbers in batches.
+          None if the numbers are saved at once.
+        backend: An AsyncBackend for saving the polled numbers off the GUI thread.
     """
-    def __init__(self, name: str, table: str = "B", parent: Optional[QObject] = None):
+    def __init__(
+        self,
+        name: str,
+        table: str = "B",
+        writeBehind: Optional[Dict[str, Any]] = None,
+        parent: Optional[QObject] = None,
+    ):
         """Extended.
 
         Args:
             table: See PollerApp.table.
+            writeBehind: The keyword arguments for WriteBehindBuffer except errorCallback.
+              If given, the polled numbers are saved in batches through writeBuffer.
         """
         super().__init__(name, parent=parent)
         self.table = table
+        self.backend = AsyncBackend(self)
+        if writeBehind is None:
+            self.writeBuffer = None
+        else:
+            self.writeBuffer = WriteBehindBuffer(**writeBehind, errorCallback=self.writeFailed)
+            self.destroyed.connect(self.writeBuffer.close)
         self.dbs = {"": ""}
         self.dbName = ""
         self.viewerFrame = ViewerFrame()
@@ -100,8 +116,8 @@ class PollerApp(BaseApp):
         newDBs = set([""])
         for db in content.get("db", ()):
             if any(key not in db for key in ("name", "path")):
-                logger.error("The message was ignored because "
-                             "the database %s has no such key; name or path.", json.dumps(db))
+                self.logger.error("The message was ignored because "
+                                  "the database %s has no such key; name or path.", json.dumps(db))
                 continue
             name, path = db["name"], db["path"]
             newDBs.add(name)
@@ -127,38 +143,69 @@ class PollerApp(BaseApp):
             if isinstance(content, dict):
                 self.updateDB(content)
             else:
-                logger.error("The message for the channel db should be a dictionary.")
+                self.logger.error("The message for the channel db should be a dictionary.")
         else:
-            logger.error("The message was ignored because "
-                         "the treatment for the channel %s is not implemented.", channelName)
+            self.logger.error("The message was ignored because "
+                              "the treatment for the channel %s is not implemented.", channelName)
 
     @pyqtSlot()
     def setPeriod(self):
         """Sets the polling period."""
         period = self.viewerFrame.periodBox.value()
         self.timer.start(1000 * period)
-        logger.info("Period is set as %ds.", period)
+        self.logger.info("Period is set as %ds.", period)
 
     @pyqtSlot()
     def setDB(self):
         """Sets the database to store the polled number."""
         self.dbName = self.viewerFrame.dbBox.currentText()
         if self.dbName:
-            logger.info("Database to store is set as %s.", self.dbName)
+            self.logger.info("Database to store is set as %s.", self.dbName)
         else:
-            logger.info("Database to store is not selected.")
+            self.logger.info("Database to store is not selected.")
 
     @pyqtSlot()
     def poll(self):
         """Polls and store a number with the selected period."""
         num = poll()
         self.count += 1
-        self.viewerFrame.countLabel.setText(f"polled count: {self.count}")
-        self.viewerFrame.numberLabel.setText(f"polled number: {num}")
-        logger.info("Polled number: %d.", num)
+        self.scheduleFrameUpdate(self.viewerFrame, functools.partial(self.showPolled, num))
+        self.logger.info("Polled number: %d.", num)
         # save the polled number
         dbPath = self.dbs[self.dbName]
-        if write(os.path.join(dbPath, self.dbName), self.table, num):
-            logger.info("Polled number saved.")
+        self.backend.write(os.path.join(dbPath, self.dbName), self.table, num,
+                           self.polledSaved, self.writeBuffer)
+
+    def polledSaved(self, isSaved: Optional[bool]):
+        """Called when saving the polled number is done.
+
+        Args:
+            isSaved: Whether the polled number is saved. See AsyncBackend.write().
+        """
+        if isSaved:
+            self.logger.info("Polled number saved.")
         else:
-            logger.error("Failed to save polled number.")
+            self.logger.error("Failed to save polled number.")
+
+    def writeFailed(self, dbPath: str, table: str, rows: List[Tuple], error: Exception):
+        """Reports the polled numbers which failed to be saved through writeBuffer.
+
+        It is called on the worker thread of writeBuffer.
+
+        Args:
+            See WriteBehindBuffer.errorCallback.
+        """
+        self.logger.error("Failed to save %d polled numbers into table %s of database %s: %s",
+                          len(rows), table, dbPath, error)
+
+    def showPolled(self, num: int):
+        """Shows the polled count and the recently polled number.
+
+        It is called through scheduleFrameUpdate(), so it is skipped while the viewer
+        frame is hidden.
+
+        Args:
+            num: The recently polled number.
+        """
+        self.viewerFrame.countLabel.setText(f"polled count: {self.count}")
+        self.viewerFrame.numberLabel.setText(f"polled number: {num}")
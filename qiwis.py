@@ -6,13 +6,17 @@ Qiwis is a main manager for qiwis system.
 Using a set-up file written by a user, it sets up apps.
 
 Usage:
-    python -m qiwis (-s <CONFIG_PATH>)
+    python -m qiwis (-c <CONFIG_PATH>) (-m) (-p) (-w) (--watch-config)
+      (--profile-startup (<PROFILE_PATH>))
 
 Logging:
     The module-level logger name is __name__.
 """
 
+# pylint: disable=too-many-lines
+
 import argparse
+import concurrent.futures
 import dataclasses
 import functools
 import importlib
@@ -20,20 +24,30 @@ import importlib.util
 import inspect
 import json
 import logging
+import math
 import os
 import sys
-from collections import defaultdict, namedtuple
-from contextlib import contextmanager
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict, defaultdict, namedtuple
+from contextlib import contextmanager, nullcontext
 from types import MappingProxyType
 from typing import (
     Dict, DefaultDict, Set, Any, Callable, Iterable, Mapping, Optional, Tuple,
     List, Union, TypeVar, Type
 )
 
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, Qt
-from PyQt5.QtGui import QColor, QIcon, QPainter, QPaintEvent, QPixmap, QCloseEvent
+from PyQt5 import sip
+from PyQt5.QtCore import (
+    QByteArray, QEvent, QFileSystemWatcher, QObject, QRect, QTimer, pyqtSignal, pyqtSlot, Qt
+)
+from PyQt5.QtGui import (
+    QColor, QIcon, QPainter, QPaintEvent, QPixmap, QCloseEvent, QResizeEvent
+)
 from PyQt5.QtWidgets import (
-    QApplication, QDockWidget, QMainWindow, QMdiArea, QMdiSubWindow, QMessageBox, QWidget
+    QApplication, QDockWidget, QMainWindow, QMdiArea, QMdiSubWindow, QMessageBox,
+    QProgressBar, QVBoxLayout, QWidget
 )
 
 T = TypeVar("T")
@@ -42,7 +56,66 @@ JsonType = Union[None, float, bool, str, List["JsonType"], Dict[str, "JsonType"]
 ImmutableJsonType = Union[None, float, bool, str, Tuple["ImmutableJsonType", ...], MappingProxyType]
 
 
+class RateLimitFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """Logging filter which limits the rate of similar log records.
+
+    The records are similar if they are logged at the same place with the same level,
+      by the same app if any. In each period, only the first burst similar records pass.
+    The records below the level always pass, so that the ordinary records, e.g.,
+      the lifecycle logs of the apps, are not lost.
+    Once some records are suppressed, only one record passes in each following period,
+      with a summary of the number of suppressed records in its message, until a period
+      passes without suppression. The summary is given to the first record after
+      the period, hence the records suppressed at the end of a burst are not reported.
+
+    It can be added to a logger, e.g., the module logger of an app, to limit the records
+      of that logger, or to a handler to limit all the records it handles.
+
+    Attributes:
+        burst: The maximum number of similar records which pass in a period.
+        period: The period in seconds.
+        level: The minimum level of the records whose rate is limited.
+    """
+
+    def __init__(self, burst: int = 10, period: float = 10, level: int = logging.WARNING):
+        """Extended.
+
+        Args:
+            See the attributes section.
+        """
+        super().__init__()
+        self.burst = burst
+        self.period = period
+        self.level = level
+        # (start time, remaining number of records to pass, number of suppressed records)
+        self._states: Dict[Tuple, List] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Overridden."""
+        if record.levelno < self.level:
+            return True
+        key = (record.name, record.pathname, record.lineno, record.levelno,
+               getattr(record, "app", None))
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or now - state[0] >= self.period:
+                suppressed = 0 if state is None else state[2]
+                self._states[key] = [now, 0 if suppressed else self.burst - 1, 0]
+                if suppressed:
+                    record.msg = (f"{record.msg} (suppressed {suppressed} similar messages "
+                                  f"in {now - state[0]:.0f} s)")
+                return True
+            if state[1] > 0:
+                state[1] -= 1
+                return True
+            state[2] += 1
+            return False
+
+
 logger = logging.getLogger(__name__)
+logger.addFilter(RateLimitFilter())
 
 
 class Serializable:  # pylint: disable=too-few-public-methods
@@ -57,7 +130,7 @@ class Serializable:  # pylint: disable=too-few-public-methods
 
 
 @dataclasses.dataclass
-class AppInfo(Serializable):
+class AppInfo(Serializable):  # pylint: disable=too-many-instance-attributes
     """Information required to create an app.
     
     Fields:
@@ -76,6 +149,12 @@ class AppInfo(Serializable):
           It should exclude the name and parent arguments.
           None for initializing the app with default values,
             where only the name and parent arguments will be passed.
+        depends: The names of the apps which should be ready before the app is created
+          by Qiwis.load(). See BaseApp.deferReady.
+        pooled: If True, the app is not deleted but kept hidden and detached in a pool
+          when it is destroyed, and it is revived when it is created again with the same
+          AppInfo. Note that the app keeps running while it is pooled, e.g., its timers.
+          See "app_pool_size" constant in _read_config_file().
     """
     module: str
     cls: str
@@ -84,6 +163,8 @@ class AppInfo(Serializable):
     channel: Iterable[str] = ()
     trust: bool = False
     args: Optional[Mapping[str, Any]] = None
+    depends: Iterable[str] = ()
+    pooled: bool = False
 
 
 def loads(cls: Type[T], kwargs: str) -> T:
@@ -141,15 +222,147 @@ class QiwiscallResult(Serializable):
     error: Optional[str] = None
 
 
+@dataclasses.dataclass
+class ProfileRecord:
+    """A single measurement of StartupProfiler.
+
+    Fields:
+        name: The name of the measured subject, e.g., an app name or a module name.
+        category: The kind of the measured work, e.g., "import", "construct", etc.
+        start: The start time in seconds, relative to the creation of the profiler.
+        duration: The elapsed time in seconds.
+        memory: The difference of the traced memory size in bytes.
+          It is always 0 when tracemalloc is not tracing.
+        thread: The identifier of the thread where the work is done.
+    """
+    name: str
+    category: str
+    start: float
+    duration: float
+    memory: int
+    thread: int
+
+
+class StartupProfiler:
+    """Profiler for finding out what makes the startup slow.
+
+    The memory difference is measured only when tracemalloc is tracing.
+    Note that the memory difference of concurrent works, e.g., imports in
+      the thread pool, includes the allocations of the other threads.
+
+    Attributes:
+        records: The list of the measured ProfileRecord objects.
+    """
+
+    def __init__(self):
+        self.records: List[ProfileRecord] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, name: str, category: str):
+        """Measures the time and the memory consumed in the 'with' statement.
+
+        It is thread-safe.
+
+        Args:
+            name: See ProfileRecord.name.
+            category: See ProfileRecord.category.
+        """
+        tracing = tracemalloc.is_tracing()
+        memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if tracing:
+                memory = tracemalloc.get_traced_memory()[0] - memory
+            record = ProfileRecord(
+                name=name,
+                category=category,
+                start=start - self._origin,
+                duration=duration,
+                memory=memory,
+                thread=threading.get_ident(),
+            )
+            with self._lock:
+                self.records.append(record)
+
+    def report(self) -> str:
+        """Returns a human-readable report table.
+
+        Each row is a measured subject, and the rows are sorted by the total time
+          in descending order.
+        """
+        categories = list(dict.fromkeys(record.category for record in self.records))
+        durations: DefaultDict[str, DefaultDict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        memories: DefaultDict[str, int] = defaultdict(int)
+        for record in self.records:
+            durations[record.name][record.category] += record.duration
+            memories[record.name] += record.memory
+        names = sorted(durations, key=lambda name: sum(durations[name].values()), reverse=True)
+        width = max((len(name) for name in names), default=0) + 2
+        columns = (*categories, "total", "memory[KiB]")
+        lines = ["Startup profile (time in seconds)",
+                 "name".ljust(width) + "".join(f"{column:>12}" for column in columns)]
+        for name in names:
+            times = durations[name]
+            cells = [f"{times[category]:12.4f}" if category in times else " " * 12
+                     for category in categories]
+            cells.append(f"{sum(times.values()):12.4f}")
+            cells.append(f"{memories[name] / 1024:12.1f}")
+            lines.append(name.ljust(width) + "".join(cells))
+        return "\n".join(lines)
+
+    def dump(self, path: str):
+        """Writes the records to a file in the Chrome trace event format.
+
+        The file can be opened with chrome://tracing or https://ui.perfetto.dev.
+
+        Args:
+            path: The path of the file to write.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": record.name,
+                "cat": record.category,
+                "ph": "X",
+                "ts": record.start * 1e6,
+                "dur": record.duration * 1e6,
+                "pid": pid,
+                "tid": record.thread,
+                "args": {"memory": record.memory},
+            }
+            for record in self.records
+        ]
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file)
+        logger.info("Dumped %d profile records to %s", len(events), path)
+
+
 class MdiArea(QMdiArea):
     """QMdiArea for the central widget.
+
+    The background is composed once per resize into a cached pixmap,
+      and only the exposed region is painted with it.
     
     Attributes:
         backgroundImage: QPixmap object for background image.
         backgroundColor: QColor object for background color.
+        isBackgroundScaled: Whether the background image is scaled to fit the area,
+          keeping its aspect ratio.
     """
 
-    def __init__(self, backgroundImage: Optional[QPixmap], backgroundColor: QColor):
+    def __init__(
+        self,
+        backgroundImage: Optional[QPixmap],
+        backgroundColor: QColor,
+        isBackgroundScaled: bool = False,
+    ):
         """Extended.
         
         Args:
@@ -158,18 +371,67 @@ class MdiArea(QMdiArea):
         super().__init__()
         self.backgroundImage = backgroundImage
         self.backgroundColor = backgroundColor
+        self.isBackgroundScaled = isBackgroundScaled
+        self._backgroundCache: Optional[QPixmap] = None
+
+    def setBackground(
+        self,
+        backgroundImage: Optional[QPixmap],
+        backgroundColor: QColor,
+        isBackgroundScaled: bool = False,
+    ):
+        """Changes the background and repaints it.
+
+        Args:
+            See the attributes section.
+        """
+        self.backgroundImage = backgroundImage
+        self.backgroundColor = backgroundColor
+        self.isBackgroundScaled = isBackgroundScaled
+        self._backgroundCache = None
+        self.viewport().update()
+
+    def _renderBackground(self) -> QPixmap:
+        """Composes the background color and the centered image for the current size."""
+        size = self.viewport().size()
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self.backgroundColor)
+        image = self.backgroundImage
+        if image is not None and not image.isNull():
+            if self.isBackgroundScaled:
+                image = image.scaled(size * ratio, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                image.setDevicePixelRatio(ratio)
+            imageSize = image.size() / image.devicePixelRatio()
+            painter = QPainter(pixmap)
+            painter.drawPixmap(
+                (size.width() - imageSize.width()) // 2,
+                (size.height() - imageSize.height()) // 2,
+                image,
+            )
+            painter.end()
+        return pixmap
 
-    def paintEvent(self, _event: QPaintEvent):
+    def resizeEvent(self, event: QResizeEvent):
+        """Extended.
+
+        Invalidates the cached background.
+        """
+        self._backgroundCache = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event: QPaintEvent):
         """Overridden.
         
-        Paints its background.
+        Paints its background in the exposed region.
         """
+        if self._backgroundCache is None:
+            self._backgroundCache = self._renderBackground()
         painter = QPainter(self.viewport())
-        painter.fillRect(self.rect(), self.backgroundColor)
-        if self.backgroundImage is not None:
-            x = (self.width() - self.backgroundImage.width()) // 2
-            y = (self.height() - self.backgroundImage.height()) // 2
-            painter.drawPixmap(x, y, self.backgroundImage)
+        # the cache is in device pixels, hence it is drawn as a whole with its pixel ratio
+        painter.setClipRegion(event.region())
+        painter.drawPixmap(0, 0, self._backgroundCache)
 
 
 class MdiSubWindow(QMdiSubWindow):
@@ -187,7 +449,143 @@ class MdiSubWindow(QMdiSubWindow):
         super().closeEvent(event)
 
 
-class Qiwis(QObject):
+class LazyFrame(QWidget):
+    """Placeholder frame which builds the actual frame when it becomes visible.
+
+    The actual frame is built by FrameWatcher, so that the frames in hidden tabs are not built.
+
+    Attributes:
+        factory: A callable object without arguments, which returns the actual frame.
+        frame: The actual frame. None until it is built.
+    """
+
+    def __init__(self, factory: Callable[[], QWidget], parent: Optional[QWidget] = None):
+        """Extended.
+
+        Args:
+            factory: See the attributes section.
+            parent: A parent widget.
+        """
+        super().__init__(parent=parent)
+        self.factory = factory
+        self.frame: Optional[QWidget] = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def materialize(self) -> QWidget:
+        """Builds the actual frame if it is not built yet, and returns it."""
+        if self.frame is None:
+            self.frame = self.factory()
+            self.layout().addWidget(self.frame)
+            logger.info("Built a lazy frame %s", self.frame.__class__.__name__)
+        return self.frame
+
+
+class FrameWatcher(QObject):
+    """Lets the apps know when their frames are shown or hidden.
+
+    The changes are collected and handed over to the apps in the next event loop iteration,
+      so that the apps are not called while the main window is being deleted.
+    The lazy frames are built when they become visible. See LazyFrame.
+
+    Attributes:
+        apps: A mapping from the app names to the live apps, which is updated by qiwis.
+    """
+
+    def __init__(self, apps: Mapping[str, "BaseApp"], mainWindow: QMainWindow):
+        """Extended.
+
+        Args:
+            apps: See the attributes section.
+            mainWindow: The main window, which is the parent of this object.
+        """
+        super().__init__(parent=mainWindow)
+        self.apps = apps
+        self._frameApps: Dict[QWidget, str] = {}
+        self._changedFrames: Set[QWidget] = set()
+        mainWindow.installEventFilter(self)
+
+    def watch(self, name: str, wrapperWidget: Union[QMdiSubWindow, QDockWidget]):
+        """Starts watching the frame in the wrapper widget.
+
+        Args:
+            name: The name of the app which owns the frame.
+            wrapperWidget: The wrapper widget of the frame to watch.
+        """
+        frame = wrapperWidget.widget()
+        self._frameApps[frame] = name
+        frame.installEventFilter(self)
+        # a dock in a hidden tab is not hidden, but it emits visibilityChanged signal
+        if isinstance(wrapperWidget, QDockWidget):
+            wrapperWidget.visibilityChanged.connect(self._dockVisibilityChanged)
+
+    def unwatch(self, wrapperWidget: Union[QMdiSubWindow, QDockWidget]):
+        """Stops watching the frame in the wrapper widget.
+
+        Args:
+            wrapperWidget: The wrapper widget of the frame to stop watching.
+        """
+        frame = wrapperWidget.widget()
+        if isinstance(wrapperWidget, QDockWidget):
+            wrapperWidget.visibilityChanged.disconnect(self._dockVisibilityChanged)
+        frame.removeEventFilter(self)
+        self._frameApps.pop(frame, None)
+        self._changedFrames.discard(frame)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Overridden.
+
+        Collects the frames which are shown or hidden. When the main window is minimized
+          or restored, all the frames are collected.
+        """
+        eventType = event.type()
+        if eventType in (QEvent.Show, QEvent.Hide) and watched in self._frameApps:
+            self._addChangedFrames((watched,))
+        elif eventType == QEvent.WindowStateChange and watched is self.parent():
+            self._addChangedFrames(self._frameApps)
+        return super().eventFilter(watched, event)
+
+    @pyqtSlot()
+    def _dockVisibilityChanged(self):
+        """Collects the frame of the dock widget whose visibility is changed.
+
+        This should be connected to QDockWidget.visibilityChanged signal.
+        """
+        self._addChangedFrames((self.sender().widget(),))
+
+    def _addChangedFrames(self, frames: Iterable[QWidget]):
+        """Adds the frames whose visibility might be changed.
+
+        Args:
+            frames: The changed frames.
+        """
+        if not self._changedFrames:
+            QTimer.singleShot(0, self._notifyApps)
+        self._changedFrames.update(frames)
+
+    @pyqtSlot()
+    def _notifyApps(self):
+        """Lets the apps check the visibility of the changed frames.
+
+        For a lazy frame, the apps check the actual frame, and they are not notified
+          until it is built. See BaseApp.checkFrameVisibility().
+        The frames which are already deleted are skipped and not watched any more.
+        """
+        changedFrames, self._changedFrames = self._changedFrames, set()
+        for frame in changedFrames:
+            if sip.isdeleted(frame):
+                self._frameApps.pop(frame, None)
+                continue
+            app = self.apps.get(self._frameApps.get(frame))
+            if isinstance(frame, LazyFrame):
+                if _is_visible(frame):
+                    frame.materialize()
+                frame = frame.frame
+            if app is not None and frame is not None:
+                app.checkFrameVisibility(frame)
+
+
+class Qiwis(QObject):  # pylint: disable=too-many-instance-attributes, too-many-public-methods
     """Actual manager for qiwis system.
 
     Note that QApplication instance must be created before instantiating Qiwis object.
@@ -199,59 +597,408 @@ class Qiwis(QObject):
     Brief procedure:
         1. Load the configuration information.
         2. Create apps and show their frames.
+
+    Signals:
+        loadProgressed(done, total): The number of the apps which have been created
+          among the apps requested by load() or loadProgressively().
+        loaded(): All the apps requested by load() or loadProgressively() are created.
     """
 
-    def __init__(
+    loadProgressed = pyqtSignal(int, int)
+    loaded = pyqtSignal()
+    _modulesImported = pyqtSignal()
+
+    # The maximum time in seconds spent for creating apps in an event loop iteration.
+    LOAD_SLICE_TIME = 0.02
+    # The delay in milliseconds for reloading apps after their module files are changed.
+    RELOAD_DELAY = 200
+    # The time in milliseconds for the waiting apps to wait for their dependencies to be ready.
+    READY_TIMEOUT = 10000
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-statements
         self,
         appInfos: Optional[Mapping[str, AppInfo]] = None,
         constants: Optional[Tuple] = None,
         isMaximized: bool = False,
+        isProgressive: bool = False,
+        profiler: Optional[StartupProfiler] = None,
+        configPath: Optional[str] = None,
+        isHeadless: bool = False,
         parent: Optional[QObject] = None):
         """
         Args:
             appInfos: See Qiwis.load(). None or an empty dictionary for loading no apps.
             constants: The global constant namespace. See set_global_constant_namespace().
             isMaximized: See "-m" option in _get_argparser().
+            isProgressive: See "-p" option in _get_argparser().
+            profiler: If given, the time for creating each app is measured with it.
+            configPath: The path of the configuration file which appInfos and constants
+              are read from. It is required for reloadConfig().
+            isHeadless: See "--headless" option in _get_argparser().
+              If True, no window is created and the frames of the apps are not built,
+              hence mainWindow and centralWidget are None.
             parent: A parent object.
         """
         super().__init__(parent=parent)
         self.appInfos: Dict[str, AppInfo] = {}
-        icon_path, background_path, background_color = (
-            getattr(constants, name, default) for name, default in
-            (("icon_path", ""), ("background_path", ""), ("background_color", "ffffff"))
-        )
-        self.mainWindow = QMainWindow()
-        backgroundImage = QPixmap(background_path) if background_path else None
-        backgroundColor = QColor(int(background_color, 16))
-        self.centralWidget = MdiArea(backgroundImage, backgroundColor)
-        self.centralWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.centralWidget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.mainWindow.setCentralWidget(self.centralWidget)
-        if icon_path:
-            self.mainWindow.setWindowIcon(QIcon(icon_path))
-        self._wrapperWidgets = defaultdict(list)
+        self.profiler = profiler
+        self.configPath = configPath
+        self.isHeadless = isHeadless
+        self.mainWindow: Optional[QMainWindow] = None
+        self.centralWidget: Optional[MdiArea] = None
+        self.loadProgressBar: Optional[QProgressBar] = None
+        self.frameWatcher: Optional[FrameWatcher] = None
         self._apps: Dict[str, BaseApp] = {}
+        if not isHeadless:
+            self._initWindow()
+        self._applyConstants(constants)
+        self._wrapperWidgets = defaultdict(list)
+        # ordered sets of the dock widgets in each area, used as a dict without values
+        self._areaDockWidgets: DefaultDict[int, Dict[QDockWidget, None]] = defaultdict(dict)
+        self._dockWidgetAreas: Dict[QDockWidget, int] = {}
+        self._frameChangeDepth = 0
         self._subscribers: DefaultDict[str, Set[str]] = defaultdict(set)
+        self._appConnections: Dict[str, Tuple[Any, ...]] = {}
+        self._appPool: "OrderedDict[str, Tuple[AppInfo, BaseApp, List[QWidget]]]" = OrderedDict()
+        self._readyApps: Set[str] = set()
+        self._waitingApps: Dict[str, AppInfo] = {}
+        # the apps which each waiting app still waits for
+        self._waitingDepends: Dict[str, Set[str]] = {}
+        self._isLoading = False
+        self._isImporting = False
+        self._isCreating = False
+        self._loadCount = 0
+        self._loadTotal = 0
+        self._modulesImported.connect(self._importedModules, type=Qt.QueuedConnection)
+        self.appWatcher: Optional[QFileSystemWatcher] = None
+        self.configWatcher: Optional[QFileSystemWatcher] = None
+        self._changedFiles: Set[str] = set()
+        self._reloadTimer = QTimer(self)
+        self._reloadTimer.setSingleShot(True)
+        self._reloadTimer.setInterval(self.RELOAD_DELAY)
+        self._reloadTimer.timeout.connect(self._reloadChangedFiles)
+        self._readyTimer = QTimer(self)
+        self._readyTimer.setSingleShot(True)
+        self._readyTimer.setInterval(self.READY_TIMEOUT)
+        self._readyTimer.timeout.connect(self._stopWaitingReady)
         appInfos = appInfos if appInfos else {}
-        self.load(appInfos)
-        if isMaximized:
-            self.mainWindow.showMaximized()
+        self._configAppInfos = dict(appInfos)
+        self._session: Optional[Dict[str, Any]] = None
+        self.loaded.connect(self._finishRestoringSession)
+        if not isProgressive:
+            self.load(appInfos)
+        if isHeadless:
+            logger.info("Qiwis runs in the headless mode")
         else:
-            self.mainWindow.show()
+            if isMaximized:
+                self.mainWindow.showMaximized()
+            else:
+                self.mainWindow.show()
+        if isProgressive:
+            self.loadProgressively(appInfos)
+
+    def _initWindow(self):
+        """Creates the main window, the central MDI area and the loading progress bar."""
+        self.mainWindow = QMainWindow()
+        self.centralWidget = MdiArea(None, QColor(Qt.white))
+        self.centralWidget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.centralWidget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.mainWindow.setCentralWidget(self.centralWidget)
+        self.loadProgressBar = QProgressBar()
+        self.loadProgressBar.setMaximumWidth(200)
+        self.loadProgressBar.hide()
+        self.loadProgressed.connect(self._updateLoadProgressBar)
+        self.mainWindow.statusBar().addPermanentWidget(self.loadProgressBar)
+        self.frameWatcher = FrameWatcher(self._apps, self.mainWindow)
+
+    def _applyConstants(self, constants: Optional[Tuple]):
+        """Applies the predefined constants to qiwis.
+
+        See _read_config_file() for the predefined constants.
+
+        Args:
+            constants: The global constant namespace. See set_global_constant_namespace().
+        """
+        self.constants = constants
+        icon_path, background_path, background_color, background_scaled, app_pool_size = (
+            getattr(constants, name, default) for name, default in (
+                ("icon_path", ""),
+                ("background_path", ""),
+                ("background_color", "ffffff"),
+                ("background_scaled", False),
+                ("app_pool_size", 4),
+            )
+        )
+        self.appPoolSize = app_pool_size
+        if self.isHeadless:
+            return
+        self.centralWidget.setBackground(
+            QPixmap(background_path) if background_path else None,
+            QColor(int(background_color, 16)),
+            background_scaled,
+        )
+        self.mainWindow.setWindowIcon(QIcon(icon_path) if icon_path else QIcon())
 
     def load(self, appInfos: Mapping[str, AppInfo]):
         """Initializes qiwis system and loads the apps.
         
+        The modules of the apps are imported concurrently in advance,
+        and then the apps are created one by one in the main thread.
+
+        An app is created only after all the apps in its AppInfo.depends are ready.
+          See BaseApp.deferReady. Therefore, some apps may be created after this
+          method returns, when their dependencies become ready in the event loop.
+        The apps which are in a dependency cycle are not created at all.
+        An app does not wait for the apps which are neither requested nor created,
+          and if its dependencies are not ready within READY_TIMEOUT while no app
+          is created, it is created anyway. Both cases are logged as errors.
+
         Args:
             appInfos: A dictionary whose keys are app names and the values are
               corresponding AppInfo objects. All the apps in the dictionary
               will be created, and its frames will be shown.
         """
+        _import_modules(appInfos.values(), profiler=self.profiler)
+        self._addWaitingApps(appInfos)
+        self._createWaitingApps(strict=True)
+
+    def loadProgressively(self, appInfos: Mapping[str, AppInfo]):
+        """Loads the apps without blocking the event loop.
+
+        The modules of the apps are imported in a background thread, and then
+          the apps are created in small slices between the event loop iterations.
+        Therefore, the main window stays responsive and each app appears as soon as
+          it is created. When all the apps are created, loaded signal is emitted.
+        An app which fails to be created is skipped after logging the error.
+        The dependencies are handled in the same way as load().
+
+        Args:
+            appInfos: See load().
+        """
+        self._addWaitingApps(appInfos)
+        if self._isImporting:
+            # the apps will be created after the current importing, without importing in advance.
+            return
+        self._isImporting = True
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(_import_modules, tuple(appInfos.values()), None, self.profiler)
+        future.add_done_callback(lambda _: self._modulesImported.emit())
+        executor.shutdown(wait=False)
+        logger.info("Started loading %d app(s) progressively", len(appInfos))
+
+    def isLoading(self) -> bool:
+        """Returns whether some apps requested by load() or loadProgressively() are not created yet.
+
+        When they are all created, loaded signal is emitted.
+        """
+        return self._isLoading
+
+    def readyAppNames(self) -> Tuple[str]:
+        """Returns the names of the apps which are ready. See BaseApp.deferReady."""
+        return tuple(self._readyApps)
+
+    def _addWaitingApps(self, appInfos: Mapping[str, AppInfo]):
+        """Adds the apps to the waiting apps which will be created when they can be.
+
+        The apps which are in a dependency cycle are discarded with an error log.
+        The dependencies on the apps which are neither waiting nor created are
+          ignored with an error log, since they would never be ready.
+
+        Args:
+            appInfos: See load().
+        """
+        if not self._isLoading:
+            self._isLoading = True
+            self._loadCount = 0
+            self._loadTotal = 0
+        self._waitingApps.update(appInfos)
+        self._loadTotal += len(appInfos)
+        dependencies = {
+            name: {dep for dep in info.depends if dep in self._waitingApps}
+            for name, info in self._waitingApps.items()
+        }
         for name, info in appInfos.items():
-            self.createApp(name, info)
-        logger.info("Loaded %d app(s)", len(appInfos))
+            self._waitingDepends[name] = self._knownDepends(name, info)
+        # find the cycles by removing the apps which do not depend on the others repeatedly
+        while dependencies:
+            independents = {name for name, deps in dependencies.items() if not deps}
+            if not independents:
+                break
+            for name in independents:
+                del dependencies[name]
+            for deps in dependencies.values():
+                deps -= independents
+        for name in dependencies:
+            logger.error("The app %s is discarded since it is in a dependency cycle", name)
+            del self._waitingApps[name]
+            del self._waitingDepends[name]
+            self._loadTotal -= 1
+        self.loadProgressed.emit(self._loadCount, self._loadTotal)
+
+    def _knownDepends(self, name: str, info: AppInfo) -> Set[str]:
+        """Returns the dependencies of the app which are waiting or created.
+
+        The other dependencies are reported with an error log.
+
+        Args:
+            name: The name of the app.
+            info: The AppInfo object of the app.
+        """
+        depends = set(info.depends)
+        unknown = depends - self._waitingApps.keys() - self._apps.keys()
+        if unknown:
+            logger.error("The app %s does not wait for the apps %s which are not requested",
+                         name, unknown)
+        return depends - unknown
+
+    def _createWaitingApps(self, deadline: Optional[float] = None, strict: bool = False) -> bool:
+        """Creates the waiting apps whose dependencies are all ready.
+
+        Args:
+            deadline: If given, it stops creating apps after this time, which is compared
+              with time.perf_counter(). It creates at least one app in any case.
+            strict: If True, an exception occurred while creating an app is propagated.
+              Otherwise, the app is skipped after logging the error.
+
+        If some apps are still waiting for their dependencies after creating the others,
+          they are created anyway after READY_TIMEOUT. See _stopWaitingReady().
+
+        Returns:
+            True if it stopped due to the deadline, i.e., there might be more apps to create.
+        """
+        self._isCreating = True
+        try:
+            with self.frameChanges():
+                while True:
+                    name = next((
+                        name for name, depends in self._waitingDepends.items()
+                        if self._readyApps.issuperset(depends)
+                    ), None)
+                    if name is None:
+                        break
+                    info = self._waitingApps.pop(name)
+                    del self._waitingDepends[name]
+                    self._loadCount += 1
+                    try:
+                        self.createApp(name, info)
+                    except Exception:  # pylint: disable=broad-exception-caught
+                        if strict:
+                            raise
+                        logger.exception("Failed to create the app %s", name)
+                    self.loadProgressed.emit(self._loadCount, self._loadTotal)
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        return True
+        finally:
+            self._isCreating = False
+        if self._waitingApps:
+            self._readyTimer.start()
+        elif self._isLoading:
+            self._readyTimer.stop()
+            self._isLoading = False
+            logger.info("Loaded %d app(s)", self._loadCount)
+            self.loadProgressed.emit(self._loadCount, self._loadTotal)
+            self.loaded.emit()
+        return False
+
+    @pyqtSlot()
+    def _stopWaitingReady(self):
+        """Creates the waiting apps without waiting for their dependencies any more.
+
+        It is called when no app is created for READY_TIMEOUT while some apps are waiting,
+          so that loading finishes even if some dependencies never become ready.
+        """
+        if self._isImporting or self._isCreating:
+            return
+        for name, depends in self._waitingDepends.items():
+            logger.error("The app %s is created without waiting for the apps %s "
+                         "which are not ready", name, depends - self._readyApps)
+            depends.clear()
+        self._createWaitingApps()
+
+    @pyqtSlot()
+    def _importedModules(self):
+        """Starts creating the apps after importing in loadProgressively()."""
+        self._isImporting = False
+        self._loadSlice()
+
+    @pyqtSlot()
+    def _loadSlice(self):
+        """Creates the waiting apps for a while.
+
+        It creates at least one app and stops after LOAD_SLICE_TIME,
+          then it is called again in the next event loop iteration.
+        """
+        if self._createWaitingApps(time.perf_counter() + self.LOAD_SLICE_TIME):
+            QTimer.singleShot(0, self._loadSlice)
+
+    def _setReady(self, name: str):
+        """Marks the app as ready and creates the apps waiting for it.
+
+        The waiting apps are created immediately, so that they can subscribe to
+          the channels before the queued messages from the ready app are delivered.
+
+        Args:
+            name: The name of the ready app.
+        """
+        if name not in self._apps:
+            return
+        self._readyApps.add(name)
+        logger.info("The app %s is ready", name)
+        if self._waitingApps and not self._isImporting and not self._isCreating:
+            self._createWaitingApps()
 
-    def addFrame(self, name: str, title: str, frame: QWidget, info: AppInfo):
+    @pyqtSlot(int, int)
+    def _updateLoadProgressBar(self, done: int, total: int):
+        """Shows the loading progress on the status bar while loading.
+
+        Args:
+            See loadProgressed signal.
+        """
+        self.loadProgressBar.setMaximum(total)
+        self.loadProgressBar.setValue(done)
+        self.loadProgressBar.setVisible(done < total)
+
+    @contextmanager
+    def frameChanges(self):
+        """Suspends the updates and the layout of the main window while changing frames.
+
+        The frames added or removed in the context are laid out and painted at once
+          when the outermost context exits. It can be nested.
+
+        Examples:
+            with qiwis.frameChanges():
+                for title, frame in frames:
+                    qiwis.addFrame(name, title, frame, info)
+        """
+        if self.isHeadless:
+            yield
+            return
+        self._frameChangeDepth += 1
+        if self._frameChangeDepth == 1:
+            self.mainWindow.setUpdatesEnabled(False)
+            self.mainWindow.layout().setEnabled(False)
+        try:
+            yield
+        finally:
+            self._frameChangeDepth -= 1
+            if self._frameChangeDepth == 0:
+                layout = self.mainWindow.layout()
+                layout.setEnabled(True)
+                layout.activate()
+                self.mainWindow.setUpdatesEnabled(True)
+                # floating docks are windows, which are not enabled with the main window
+                for wrapperWidgets in self._wrapperWidgets.values():
+                    for wrapperWidget in wrapperWidgets:
+                        if wrapperWidget.isWindow():
+                            wrapperWidget.setUpdatesEnabled(True)
+
+    def addFrame(
+        self,
+        name: str,
+        title: str,
+        frame: Union[QWidget, Callable[[], QWidget]],
+        info: AppInfo,
+    ):
         """Adds the given frame and wraps it with a wrapper widget.
 
         This is not a qiwiscall because QWidget is not Serializable.
@@ -259,39 +1006,132 @@ class Qiwis(QObject):
         Args:
             name: The app name to which frame is added.
             title: The frame title.
-            frame: The frame widget to show.
+            frame: The frame widget to show, or a frame factory which returns it.
+              For a frame factory, a LazyFrame is added instead.
             info: The AppInfo object describing the app.
         """
+        if not isinstance(frame, QWidget):
+            frame = LazyFrame(frame)
         frameTitle = f"{name} - {title}" if title else name
         if info.pos == "center":
-            wrapperWidget = MdiSubWindow(self.centralWidget)
+            wrapperWidget = MdiSubWindow()
             wrapperWidget.setWindowTitle(frameTitle)
             wrapperWidget.setWidget(frame)
             wrapperWidget.closed.connect(functools.partial(self.destroyApp, name))
-            wrapperWidget.show()
         else:
             wrapperWidget = QDockWidget(frameTitle, self.mainWindow)
             wrapperWidget.setWidget(frame)
-            area = {
-                "left": Qt.LeftDockWidgetArea,
-                "right": Qt.RightDockWidgetArea,
-                "top": Qt.TopDockWidgetArea,
-                "bottom": Qt.BottomDockWidgetArea,
-                "floating": Qt.LeftDockWidgetArea  # temporary area
-            }.get(info.pos, Qt.LeftDockWidgetArea)
-            areaDockWidgets = [
-                dockWidget for dockWidget in self.mainWindow.findChildren(QDockWidget)
-                if self.mainWindow.dockWidgetArea(dockWidget) == area
-            ]
-            if areaDockWidgets:
-                self.mainWindow.tabifyDockWidget(areaDockWidgets[-1], wrapperWidget)
-            else:
-                self.mainWindow.addDockWidget(area, wrapperWidget)
-            if info.pos == "floating":
-                wrapperWidget.setFloating(True)
+        wrapperWidget.setObjectName(frameTitle)
+        self.frameWatcher.watch(name, wrapperWidget)
+        self._attachWrapperWidget(wrapperWidget, info.pos)
         self._wrapperWidgets[name].append(wrapperWidget)
         logger.info("Added a frame %s to the app %s: %s", title, name, info)
 
+    def _attachWrapperWidget(self, wrapperWidget: Union[QMdiSubWindow, QDockWidget], pos: str):
+        """Places the wrapper widget on the main window and shows it.
+
+        Args:
+            wrapperWidget: The wrapper widget to place.
+            pos: See AppInfo.pos.
+        """
+        if isinstance(wrapperWidget, QMdiSubWindow):
+            self.centralWidget.addSubWindow(wrapperWidget)
+            # the wrapper widget is deleted by removeFrame(), not when it is closed
+            wrapperWidget.setAttribute(Qt.WA_DeleteOnClose, False)
+            wrapperWidget.show()
+            if self._session is not None:
+                geometries = self._session.get("subwindow_geometry", {})
+                geometry = geometries.get(wrapperWidget.objectName())
+                if geometry is not None:
+                    wrapperWidget.setGeometry(QRect(*geometry))
+            return
+        if self._session is not None and self.mainWindow.restoreDockWidget(wrapperWidget):
+            if not wrapperWidget.isFloating():
+                self._indexDockWidget(wrapperWidget, self.mainWindow.dockWidgetArea(wrapperWidget))
+        else:
+            self._addDockWidget(wrapperWidget, pos)
+        wrapperWidget.dockLocationChanged.connect(self._dockLocationChanged)
+
+    def _addDockWidget(self, dockWidget: QDockWidget, pos: str):
+        """Adds the dock widget to the area given by pos and shows it.
+
+        If there are other dock widgets in the area, it is tabified with the last one.
+
+        Args:
+            dockWidget: The dock widget to add.
+            pos: See AppInfo.pos.
+        """
+        area = {
+            "left": Qt.LeftDockWidgetArea,
+            "right": Qt.RightDockWidgetArea,
+            "top": Qt.TopDockWidgetArea,
+            "bottom": Qt.BottomDockWidgetArea,
+            "floating": Qt.LeftDockWidgetArea  # temporary area
+        }.get(pos, Qt.LeftDockWidgetArea)
+        areaDockWidgets = self._areaDockWidgets[area]
+        if areaDockWidgets:
+            self.mainWindow.tabifyDockWidget(next(reversed(areaDockWidgets)), dockWidget)
+        else:
+            self.mainWindow.addDockWidget(area, dockWidget)
+        self._indexDockWidget(dockWidget, area)
+        dockWidget.show()
+        if pos == "floating":
+            dockWidget.setFloating(True)
+
+    def _detachWrapperWidget(self, wrapperWidget: Union[QMdiSubWindow, QDockWidget]):
+        """Removes the wrapper widget from the main window without deleting it.
+
+        Args:
+            wrapperWidget: The wrapper widget to remove.
+        """
+        if isinstance(wrapperWidget, QMdiSubWindow):
+            self.centralWidget.removeSubWindow(wrapperWidget)
+        else:
+            wrapperWidget.dockLocationChanged.disconnect(self._dockLocationChanged)
+            self._unindexDockWidget(wrapperWidget)
+            self.mainWindow.removeDockWidget(wrapperWidget)
+        wrapperWidget.hide()
+
+    def _indexDockWidget(self, dockWidget: QDockWidget, area: int):
+        """Records the dock widget as the last one in the area.
+
+        If the dock widget is already recorded in the area, nothing happens.
+
+        Args:
+            dockWidget: The dock widget to record.
+            area: The Qt.DockWidgetArea where the dock widget is placed.
+        """
+        if self._dockWidgetAreas.get(dockWidget) == area:
+            return
+        self._unindexDockWidget(dockWidget)
+        self._dockWidgetAreas[dockWidget] = area
+        self._areaDockWidgets[area][dockWidget] = None
+
+    def _unindexDockWidget(self, dockWidget: QDockWidget):
+        """Forgets the area of the dock widget.
+
+        Args:
+            dockWidget: The dock widget to forget.
+        """
+        area = self._dockWidgetAreas.pop(dockWidget, None)
+        if area is not None:
+            self._areaDockWidgets[area].pop(dockWidget, None)
+
+    @pyqtSlot(Qt.DockWidgetArea)
+    def _dockLocationChanged(self, area: int):
+        """Updates the area of the dock widget moved by the user.
+
+        This should be connected to QDockWidget.dockLocationChanged signal.
+
+        Args:
+            area: The new Qt.DockWidgetArea of the dock widget.
+        """
+        dockWidget = self.sender()
+        if area == Qt.NoDockWidgetArea:
+            self._unindexDockWidget(dockWidget)
+        else:
+            self._indexDockWidget(dockWidget, area)
+
     def removeFrame(self, name: str, wrapperWidget: Union[QMdiSubWindow, QDockWidget]):
         """Removes the frame from the main window.
         
@@ -302,11 +1142,11 @@ class Qiwis(QObject):
             wrapperWidget: The wrapper widget to remove.
         """
         frameName = wrapperWidget.widget().__class__.__name__
-        if isinstance(wrapperWidget, QMdiSubWindow):
-            self.centralWidget.removeSubWindow(wrapperWidget)
-        else:
-            self.mainWindow.removeDockWidget(wrapperWidget)
+        self.frameWatcher.unwatch(wrapperWidget)
+        self._detachWrapperWidget(wrapperWidget)
         self._wrapperWidgets[name].remove(wrapperWidget)
+        # prevents confusion with a new wrapper widget until it is deleted
+        wrapperWidget.setObjectName("")
         wrapperWidget.deleteLater()
         logger.info("Removed a frame %s from the app %s", frameName, name)
 
@@ -314,8 +1154,14 @@ class Qiwis(QObject):
         """Returns the names of the apps including whose frames are hidden."""
         return tuple(self._apps.keys())
 
+    def pooledAppNames(self) -> Tuple[str]:
+        """Returns the names of the pooled apps from the least recently pooled one."""
+        return tuple(self._appPool.keys())
+
     def createApp(self, name: str, info: AppInfo, replace: bool = False):
         """Creates an app and shows their frames using set-up environment.
+
+        Note that it creates the app immediately regardless of info.depends.
         
         Args:
             name: The name of the app to be added.
@@ -326,67 +1172,556 @@ class Qiwis(QObject):
         if name in self._apps:
             if replace:
                 self.destroyApp(name)
+                self._evictPooledApp(name)
             else:
                 logger.error("The app %s already exists.", name)
                 return
-        with _add_to_path(os.path.dirname(info.path)):
-            module = importlib.import_module(info.module)
+        if name in self._appPool:
+            if self._appPool[name][0] == info:
+                self._revivePooledApp(name)
+                return
+            self._evictPooledApp(name)
+        self._installApp(name, info, self._constructApp(name, info))
+
+    def _constructApp(self, name: str, info: AppInfo) -> "BaseApp":
+        """Imports the module of the app if it is not imported yet, and constructs the app.
+
+        The app is not added to qiwis yet. See _installApp().
+
+        Args:
+            name: The name of the app.
+            info: The AppInfo object describing the app.
+        """
+        module = sys.modules.get(info.module)
+        if module is None:
+            with _add_to_path(os.path.dirname(info.path)), \
+                 _measure(self.profiler, info.module, "import"):
+                module = importlib.import_module(info.module)
         cls = getattr(module, info.cls)
         cls._constants = BaseApp._constants  # pylint: disable=protected-access
-        if info.args is not None:
-            app = cls(name, parent=self, **info.args)
-        else:
-            app = cls(name, parent=self)
-        app.broadcastRequested.connect(self._broadcast, type=Qt.QueuedConnection)
-        app.qiwiscallRequested.connect(
-            functools.partial(self._qiwiscall, name),
-            type=Qt.QueuedConnection,
-        )
+        with _measure(self.profiler, name, "construct"):
+            if info.args is not None:
+                return cls(name, parent=self, **info.args)
+            return cls(name, parent=self)
+
+    def _installApp(self, name: str, info: AppInfo, app: "BaseApp"):
+        """Adds the constructed app to qiwis and shows its frames.
+
+        Args:
+            name: The name of the app.
+            info: The AppInfo object describing the app.
+            app: The app constructed by _constructApp().
+        """
+        self._connectApp(name, app)
         for channelName in info.channel:
             self.subscribe(name, channelName)
-        for title, frame in app.frames():
-            self.addFrame(name, title, frame, info)
+        if not self.isHeadless:
+            self._addFrames(name, app, info)
         self._apps[name] = app
         self.appInfos[name] = info
+        self._restoreAppState(name, app)
+        if self.appWatcher is not None:
+            self._watchModule(info.module)
         logger.info("Created an app %s: %s", name, info)
+        if not app.deferReady:
+            self._setReady(name)
+
+    def _addFrames(self, name: str, app: "BaseApp", info: AppInfo):
+        """Adds all the frames of the newly created app.
+
+        Args:
+            name: The name of the app.
+            app: The app whose frames are added.
+            info: The AppInfo object describing the app.
+        """
+        with _measure(self.profiler, name, "frames"):
+            frames = tuple(app.frames())
+        for title, frame in frames:
+            with _measure(self.profiler, name, "addFrame"):
+                self.addFrame(name, title, frame, info)
 
     def destroyApp(self, name: str):
         """Destroys an app.
+
+        If the app is pooled, i.e., AppInfo.pooled is True, it is kept in the pool
+          instead of being deleted. See _poolApp().
         
         Args:
             name: A name of the app to destroy.
         """
-        wrapperWidgets = self._wrapperWidgets[name]
-        for wrapperWidget in wrapperWidgets:
-            self.removeFrame(name, wrapperWidget)
+        if self.appInfos[name].pooled and self.appPoolSize > 0:
+            self._poolApp(name)
+            return
+        with self.frameChanges():
+            for wrapperWidget in tuple(self._wrapperWidgets[name]):
+                self.removeFrame(name, wrapperWidget)
         del self._wrapperWidgets[name]
         for apps in self._subscribers.values():
             apps.discard(name)
+        self._disconnectApp(name, self._apps[name])
         self._apps.pop(name).deleteLater()
         self.appInfos.pop(name)
+        self._readyApps.discard(name)
         logger.info("Destroyed the app %s", name)
 
+    def _connectApp(self, name: str, app: "BaseApp"):
+        """Connects the signals of the app to qiwis.
+
+        Args:
+            name: The name of the app.
+            app: The app object.
+        """
+        self._appConnections[name] = (
+            app.broadcastRequested.connect(self._broadcast, type=Qt.QueuedConnection),
+            app.qiwiscallRequested.connect(
+                functools.partial(self._qiwiscall, name),
+                type=Qt.QueuedConnection,
+            ),
+            app.readyNotified.connect(functools.partial(self._setReady, name)),
+        )
+
+    def _disconnectApp(self, name: str, app: "BaseApp"):
+        """Disconnects the signals of the app connected by _connectApp().
+
+        Args:
+            name: The name of the app.
+            app: The app object.
+        """
+        broadcastConnection, qiwiscallConnection, readyConnection = (
+            self._appConnections.pop(name)
+        )
+        app.broadcastRequested.disconnect(broadcastConnection)
+        app.qiwiscallRequested.disconnect(qiwiscallConnection)
+        app.readyNotified.disconnect(readyConnection)
+
+    def _poolApp(self, name: str):
+        """Hides and detaches the app, and keeps it in the pool.
+
+        The app is disconnected from qiwis and all of its subscriptions are canceled.
+        When the pool is full, the least recently pooled app is deleted.
+
+        Args:
+            name: The name of the app to pool.
+        """
+        app = self._apps.pop(name)
+        info = self.appInfos.pop(name)
+        wrapperWidgets = self._wrapperWidgets.pop(name, [])
+        for wrapperWidget in wrapperWidgets:
+            self._detachWrapperWidget(wrapperWidget)
+        for apps in self._subscribers.values():
+            apps.discard(name)
+        self._disconnectApp(name, app)
+        self._readyApps.discard(name)
+        self._appPool[name] = (info, app, wrapperWidgets)
+        logger.info("Pooled the app %s", name)
+        while len(self._appPool) > self.appPoolSize:
+            self._evictPooledApp(next(iter(self._appPool)))
+
+    def _revivePooledApp(self, name: str):
+        """Revives the pooled app, i.e., reconnects it and reattaches its frames.
+
+        The subscriptions are reset to AppInfo.channel.
+
+        Args:
+            name: The name of the pooled app.
+        """
+        info, app, wrapperWidgets = self._appPool.pop(name)
+        self._connectApp(name, app)
+        for channelName in info.channel:
+            self.subscribe(name, channelName)
+        for wrapperWidget in wrapperWidgets:
+            self._attachWrapperWidget(wrapperWidget, info.pos)
+        self._wrapperWidgets[name] = wrapperWidgets
+        self._apps[name] = app
+        self.appInfos[name] = info
+        logger.info("Revived the pooled app %s", name)
+        self._setReady(name)
+
+    def _evictPooledApp(self, name: str):
+        """Deletes the pooled app, if any.
+
+        Args:
+            name: The name of the pooled app.
+        """
+        if name not in self._appPool:
+            return
+        _info, app, wrapperWidgets = self._appPool.pop(name)
+        for wrapperWidget in wrapperWidgets:
+            self.frameWatcher.unwatch(wrapperWidget)
+            wrapperWidget.setObjectName("")
+            wrapperWidget.deleteLater()
+        app.deleteLater()
+        logger.info("Evicted the pooled app %s", name)
+
+    def saveSession(self, path: str):
+        """Saves the current session into a file, which can be restored by restoreSession().
+
+        The session consists of the live apps, the layout of the main window,
+          the geometries of the MDI sub-windows and the states of the apps.
+        The state returned by BaseApp.saveState() is saved only if it is JSON-serializable.
+
+        Args:
+            path: The path of the session file.
+        """
+        appStates = {}
+        for name, app in self._apps.items():
+            state = app.saveState()
+            if state is None:
+                continue
+            try:
+                json.dumps(state)
+            except (TypeError, ValueError):
+                logger.warning("The state of the app %s is not saved since it is not "
+                               "JSON-serializable: %r", name, state)
+                continue
+            appStates[name] = state
+        session = {
+            "app": {name: dataclasses.asdict(info) for name, info in self.appInfos.items()},
+            "state": appStates,
+        }
+        if not self.isHeadless:
+            session["window_geometry"] = bytes(self.mainWindow.saveGeometry().toBase64()).decode()
+            session["window_state"] = bytes(self.mainWindow.saveState().toBase64()).decode()
+            session["subwindow_geometry"] = {
+                wrapperWidget.objectName(): wrapperWidget.geometry().getRect()
+                for wrapperWidgets in self._wrapperWidgets.values()
+                for wrapperWidget in wrapperWidgets
+                if isinstance(wrapperWidget, QMdiSubWindow)
+            }
+        with open(path, "w", encoding="utf-8") as session_file:
+            json.dump(session, session_file, separators=(",", ":"))
+        logger.info("Saved the session of %d app(s) to %s", len(self._apps), path)
+
+    def restoreSession(self, path: str):
+        """Loads the apps in the session saved by saveSession() and restores it.
+
+        The layout of the main window is restored first, and then each frame is placed
+          at its saved position as soon as it is added, without being laid out twice.
+        The state of each app is restored by BaseApp.restoreState() right after it is created.
+
+        Args:
+            path: The path of the session file.
+        """
+        with open(path, encoding="utf-8") as session_file:
+            session: Dict[str, Any] = json.load(session_file)
+        appInfos = {name: AppInfo(**info) for name, info in session.get("app", {}).items()}
+        self._session = session
+        if not self.isHeadless:
+            if "window_geometry" in session:
+                self.mainWindow.restoreGeometry(
+                    QByteArray.fromBase64(session["window_geometry"].encode())
+                )
+            if "window_state" in session:
+                self.mainWindow.restoreState(
+                    QByteArray.fromBase64(session["window_state"].encode())
+                )
+        try:
+            self.load(appInfos)
+        finally:
+            if not self._isLoading:
+                self._finishRestoringSession()
+        logger.info("Restored the session of %d app(s) from %s", len(appInfos), path)
+
+    def _restoreAppState(self, name: str, app: "BaseApp"):
+        """Restores the state of the app saved in the session being restored, if any.
+
+        Args:
+            name: The name of the app.
+            app: The newly created app.
+        """
+        if self._session is None:
+            return
+        appStates = self._session.get("state", {})
+        if name in appStates:
+            app.restoreState(appStates[name])
+
+    @pyqtSlot()
+    def _finishRestoringSession(self):
+        """Stops restoring the session after all the apps in it are loaded."""
+        self._session = None
+
+    def reloadApp(self, name: str) -> bool:
+        """Reloads the module of an app and replaces the app with a new one.
+
+        The new app is created with the same AppInfo object, and it inherits
+          the subscriptions and the frame positions of the original app.
+        The state of the original app is handed over to the new app through
+          BaseApp.saveState() and BaseApp.restoreState().
+        Note that only the module of the app is reloaded, not the modules it imports.
+        The new app is constructed before the original app is destroyed. Therefore,
+          if reloading the module or constructing the new app fails, e.g., due to
+          a syntax error in a half-saved file, the error is logged and the original app
+          keeps running.
+
+        Args:
+            name: The name of the app to reload.
+
+        Returns:
+            True if the app is reloaded, otherwise False.
+        """
+        snapshot = self._snapshotApp(name)
+        if not self._reloadModule(self.appInfos[name]):
+            return False
+        return self._rebuildApp(name, snapshot)
+
+    def _reloadModule(self, info: AppInfo) -> bool:
+        """Reloads the module of the app, if it is imported.
+
+        If it fails, the error is logged.
+
+        Args:
+            info: The AppInfo object of the app.
+
+        Returns:
+            False if reloading the module fails, otherwise True.
+        """
+        module = sys.modules.get(info.module)
+        if module is None:
+            return True
+        try:
+            with _add_to_path(os.path.dirname(info.path)):
+                importlib.reload(module)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to reload the module %s, hence its apps are kept",
+                             info.module)
+            return False
+        return True
+
+    def _snapshotApp(self, name: str) -> Tuple[Any, List[str], Optional[QByteArray], List[QRect]]:
+        """Returns what the app hands over to the new app in _rebuildApp().
+
+        It should be called before the module of the app is reloaded,
+          since the state is saved by the code of the original module.
+
+        Args:
+            name: The name of the app.
+
+        Returns:
+            A tuple of the state of the app, the channels it subscribes to, the state of
+              the main window and the geometries of its MDI sub-windows.
+        """
+        state = self._apps[name].saveState()
+        channels = [channel for channel, apps in self._subscribers.items() if name in apps]
+        windowState = None if self.isHeadless else self.mainWindow.saveState()
+        geometries = [
+            wrapperWidget.geometry() for wrapperWidget in self._wrapperWidgets[name]
+            if isinstance(wrapperWidget, QMdiSubWindow)
+        ]
+        return state, channels, windowState, geometries
+
+    def _rebuildApp(
+        self,
+        name: str,
+        snapshot: Tuple[Any, List[str], Optional[QByteArray], List[QRect]],
+    ) -> bool:
+        """Replaces the app with a new one constructed from the current module.
+
+        If constructing the new app fails, the error is logged and the original app is kept.
+
+        Args:
+            name: The name of the app.
+            snapshot: The snapshot of the original app returned by _snapshotApp().
+
+        Returns:
+            True if the app is replaced, otherwise False.
+        """
+        info = self.appInfos[name]
+        state, channels, windowState, geometries = snapshot
+        try:
+            newApp = self._constructApp(name, info)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to construct the reloaded app %s, hence the app is kept",
+                             name)
+            return False
+        self.destroyApp(name)
+        self._evictPooledApp(name)
+        self._installApp(name, info, newApp)
+        for channel in channels:
+            if name not in self._subscribers[channel]:
+                self.subscribe(name, channel)
+        if windowState is not None:
+            self.mainWindow.restoreState(windowState)
+        subWindows = (
+            wrapperWidget for wrapperWidget in self._wrapperWidgets[name]
+            if isinstance(wrapperWidget, QMdiSubWindow)
+        )
+        for subWindow, geometry in zip(subWindows, geometries):
+            subWindow.setGeometry(geometry)
+        self._apps[name].restoreState(state)
+        logger.info("Reloaded the app %s", name)
+        return True
+
+    def reloadConfig(self):
+        """Reads the configuration file again and applies only the changes.
+
+        The changes are compared with the configuration which was read previously,
+          hence the apps created by qiwiscalls are not affected.
+          - Removed apps are destroyed.
+          - Added apps are loaded by load().
+          - If only AppInfo.channel of an app is changed, the subscriptions are updated.
+          - If the other fields of AppInfo of an app are changed, the app is replaced.
+          - Unchanged apps keep running untouched.
+        When the constants are changed, the global constant namespace is replaced.
+        """
+        if self.configPath is None:
+            raise RuntimeError("The configuration file path is not given.")
+        appInfos, constants = _read_config_file(self.configPath)
+        oldConstants = {} if self.constants is None else self.constants._asdict()
+        if oldConstants != {name: _immutable(value) for name, value in constants.items()}:
+            constants_ = set_global_constant_namespace(constants)
+            for app in (*self._apps.values(), *(app for _, app, _ in self._appPool.values())):
+                type(app)._constants = constants_  # pylint: disable=protected-access
+            self._applyConstants(constants_)
+            logger.info("Applied the changed constants")
+        oldAppInfos, self._configAppInfos = self._configAppInfos, dict(appInfos)
+        for name in oldAppInfos.keys() - appInfos.keys():
+            self._waitingApps.pop(name, None)
+            self._waitingDepends.pop(name, None)
+            if name in self._apps:
+                self.destroyApp(name)
+        addedAppInfos = {}
+        for name, info in appInfos.items():
+            oldInfo = oldAppInfos.get(name)
+            if info == oldInfo:
+                continue
+            if name in self._waitingApps:
+                self._waitingApps[name] = info
+                self._waitingDepends[name] = self._knownDepends(name, info)
+            elif name not in self._apps:
+                addedAppInfos[name] = info
+            elif dataclasses.replace(oldInfo, channel=info.channel) == info:
+                self._updateChannels(name, oldInfo.channel, info.channel)
+                self.appInfos[name] = info
+            else:
+                self.createApp(name, info, replace=True)
+        if addedAppInfos:
+            self.load(addedAppInfos)
+        logger.info("Reloaded the configuration file %s", self.configPath)
+
+    def watchConfig(self):
+        """Starts watching the configuration file and reloads it when changed.
+
+        The configuration is reloaded by reloadConfig() after RELOAD_DELAY.
+        """
+        if self.configWatcher is not None:
+            return
+        if self.configPath is None:
+            raise RuntimeError("The configuration file path is not given.")
+        self.configWatcher = QFileSystemWatcher([self.configPath], self)
+        self.configWatcher.fileChanged.connect(self._fileChanged)
+        logger.info("Started watching the configuration file %s", self.configPath)
+
+    def _updateChannels(self, name: str, oldChannels: Iterable[str], newChannels: Iterable[str]):
+        """Updates the subscriptions of the app from the old channels to the new channels.
+
+        Args:
+            name: The name of the app.
+            oldChannels: The channels which the app used to subscribe to.
+            newChannels: The channels which the app should subscribe to.
+        """
+        oldChannels, newChannels = set(oldChannels), set(newChannels)
+        for channel in oldChannels - newChannels:
+            self.unsubscribe(name, channel)
+        for channel in newChannels - oldChannels:
+            self.subscribe(name, channel)
+
+    def watchApps(self):
+        """Starts watching the module files of the apps and reloads them when changed.
+
+        The apps whose module file is changed are reloaded in the same way as reloadApp()
+          after RELOAD_DELAY, so that successive changes are reloaded at once.
+          A module shared by several apps is reloaded once, and all the apps are replaced.
+        """
+        if self.appWatcher is not None:
+            return
+        self.appWatcher = QFileSystemWatcher(self)
+        self.appWatcher.fileChanged.connect(self._fileChanged)
+        for info in self.appInfos.values():
+            self._watchModule(info.module)
+        logger.info("Started watching %d module file(s)", len(self.appWatcher.files()))
+
+    def _watchModule(self, module: str):
+        """Adds the file of the module to the app watcher.
+
+        Args:
+            module: The name of the module to watch.
+        """
+        path = getattr(sys.modules.get(module), "__file__", None)
+        if path is not None and path not in self.appWatcher.files():
+            self.appWatcher.addPath(path)
+
+    @pyqtSlot(str)
+    def _fileChanged(self, path: str):
+        """Schedules reloading the apps whose module file is changed.
+
+        Args:
+            path: The path of the changed file.
+        """
+        # some editors replace the file, which removes the path from the watcher
+        watcher = self.sender()
+        if os.path.exists(path) and path not in watcher.files():
+            watcher.addPath(path)
+        self._changedFiles.add(path)
+        self._reloadTimer.start()
+
+    @pyqtSlot()
+    def _reloadChangedFiles(self):
+        """Reloads the configuration or the apps whose file is changed."""
+        changedFiles, self._changedFiles = self._changedFiles, set()
+        if self.configWatcher is not None and self.configPath in changedFiles:
+            try:
+                self.reloadConfig()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Failed to reload the configuration file %s", self.configPath)
+        if self.appWatcher is None:
+            return
+        moduleApps: DefaultDict[str, List[str]] = defaultdict(list)
+        for name, info in self.appInfos.items():
+            if getattr(sys.modules.get(info.module), "__file__", None) in changedFiles:
+                moduleApps[info.module].append(name)
+        for names in moduleApps.values():
+            try:
+                # the states should be saved before the module is reloaded
+                snapshots = {name: self._snapshotApp(name) for name in names}
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Failed to save the states of the apps %s", names)
+                continue
+            if not self._reloadModule(self.appInfos[names[0]]):
+                continue
+            for name, snapshot in snapshots.items():
+                try:
+                    self._rebuildApp(name, snapshot)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Failed to reload the app %s", name)
+
     def updateFrames(self, name: str):
         """Updates frames of the given app.
+
+        It does nothing in the headless mode.
         
         Args:
             name: The app name to update its frames.
         """
+        if self.isHeadless:
+            return
         app = self._apps[name]
         info = self.appInfos[name]
-        wrapperWidgets = {
-            wrapperWidget.widget(): wrapperWidget
-            for wrapperWidget in self._wrapperWidgets[name]
-        }
+        wrapperWidgets = {}
+        for wrapperWidget in self._wrapperWidgets[name]:
+            frame = wrapperWidget.widget()
+            if isinstance(frame, LazyFrame):
+                frame = frame.factory
+            wrapperWidgets[frame] = wrapperWidget
         frameTitles = {frame: title for title, frame in app.frames()}
         orgFramesSet = set(wrapperWidgets)
         newFramesSet = set(frameTitles)
-        for frame in orgFramesSet - newFramesSet:
-            wrapperWidget = wrapperWidgets[frame]
-            self.removeFrame(name, wrapperWidget)
-        for frame in newFramesSet - orgFramesSet:
-            title = frameTitles[frame]
-            self.addFrame(name, title, frame, info)
+        with self.frameChanges():
+            for frame in orgFramesSet - newFramesSet:
+                wrapperWidget = wrapperWidgets[frame]
+                self.removeFrame(name, wrapperWidget)
+            for frame in newFramesSet - orgFramesSet:
+                title = frameTitles[frame]
+                self.addFrame(name, title, frame, info)
         logger.info("Updated frames: %d -> %d", len(orgFramesSet), len(newFramesSet))
 
     def channelNames(self) -> Tuple[str]:
@@ -500,6 +1835,11 @@ class Qiwis(QObject):
         args = self._parseArgs(call, info.args)
         trust = self.appInfos[sender].trust
         if not trust:
+            if self.isHeadless:
+                raise RuntimeError(
+                    f"The untrusted app {sender} cannot request for a qiwiscall "
+                    "in the headless mode."
+                )
             reply = QMessageBox.warning(
                 None,
                 "qiwiscall",
@@ -547,16 +1887,38 @@ class BaseApp(QObject):
         qiwiscallReturned(request, result): The result of the requested qiwiscall
           with the original requested message and the result message converted
           from a qiwis.QiwiscallResult object by qiwis.dumps().
+        readyNotified(): The app is ready. See deferReady.
+        frameVisibilityChanged(frame, visible): The visibility of the frame is changed,
+          e.g., its dock becomes a hidden tab or the main window is minimized.
     
     Attributes:
         name: The string identifier name of this app.
         qiwiscall: A qiwiscall proxy for requesting qiwiscalls conveniently.
+        logger: A logger adapter of the logger named after the module of the app class.
+          The name of the app is given to its records as "app" attribute.
+        deferReady: If False, the app is regarded as ready right after it is created.
+          Otherwise, it is ready when it calls notifyReady(), e.g., after it publishes
+          its initial state. The apps which depend on this app are created after
+          it is ready. See AppInfo.depends.
+        frameUpdateRate: The maximum number of updates per second of each frame
+          by scheduleFrameUpdate(). None for no limit.
+        logRateLimit: The burst and the period of a RateLimitFilter which is added to
+          the logger of the app, if it does not have one yet. None for no limit.
+          Note that the logger is shared by the apps of the same module.
     """
 
     broadcastRequested = pyqtSignal(str, str)
     received = pyqtSignal(str, str)
     qiwiscallRequested = pyqtSignal(str)
     qiwiscallReturned = pyqtSignal(str, str)
+    readyNotified = pyqtSignal()
+    frameVisibilityChanged = pyqtSignal(QWidget, bool)
+
+    deferReady = False
+
+    frameUpdateRate: Optional[float] = None
+
+    logRateLimit: Optional[Tuple[int, float]] = (10, 10)
 
     _constants = namedtuple("EmptyNamespace", ())()
 
@@ -569,20 +1931,32 @@ class BaseApp(QObject):
         super().__init__(parent=parent)
         self.name = name
         self.qiwiscall = QiwiscallProxy(self.qiwiscallRequested)
+        self.logger = logging.LoggerAdapter(logging.getLogger(type(self).__module__), {"app": name})
+        if self.logRateLimit is not None and not any(
+            isinstance(filter_, RateLimitFilter) for filter_ in self.logger.logger.filters
+        ):
+            self.logger.logger.addFilter(RateLimitFilter(*self.logRateLimit))
         self.received.connect(self._receivedMessage)
         self.qiwiscallReturned.connect(self._receivedQiwiscallResult)
+        self._frameVisibilities: Dict[QWidget, bool] = {}
+        self._frameUpdates: Dict[QWidget, Callable[[], Any]] = {}
+        self._frameUpdateTimes: Dict[QWidget, float] = {}
 
     @property
     def constants(self) -> Tuple:
         """The global constant namespace."""
         return self._constants
 
-    def frames(self) -> Iterable[Tuple[str, QWidget]]:
+    def frames(self) -> Iterable[Tuple[str, Union[QWidget, Callable[[], QWidget]]]]:
         """Returns frames info for showing.
 
         Returns:
             An iterable object with frames info for showing.
             Each entry is a tuple with frame title and frame object.
+            Instead of a frame object, a frame factory, i.e., a callable object
+              without arguments which returns a frame object, can be given.
+              Then the frame is built when it is shown for the first time.
+              See LazyFrame. The same factory should be returned for the same frame.
         """
         return ()
 
@@ -602,6 +1976,96 @@ class BaseApp(QObject):
                          channelName, msg, content)
             self.broadcastRequested.emit(channelName, msg)
 
+    def saveState(self) -> Any:
+        """Returns the state of the app which is handed over to restoreState().
+
+        This is called before the app is replaced, e.g., by Qiwis.reloadApp(),
+          and when the session is saved by Qiwis.saveSession(). In the latter case,
+          the state should be JSON-serializable to be saved.
+        This will be overridden by child classes.
+        """
+        return None
+
+    def restoreState(self, state: Any):
+        """Restores the state of the app.
+
+        This is called right after the app is created to replace another app,
+          or to restore a saved session.
+        This will be overridden by child classes.
+
+        Args:
+            state: The returned value of saveState() of the replaced app.
+        """
+
+    def notifyReady(self):
+        """Notifies that the app is ready. See deferReady."""
+        self.readyNotified.emit()
+
+    def isFrameVisible(self, frame: QWidget) -> bool:
+        """Returns whether the frame can be seen on the screen.
+
+        A frame in a hidden tab or in a minimized window is not visible.
+
+        Args:
+            frame: The frame of interest.
+        """
+        return _is_visible(frame)
+
+    def checkFrameVisibility(self, frame: QWidget):
+        """Emits frameVisibilityChanged signal if the visibility of the frame is changed.
+
+        This is called by qiwis after a frame is shown or hidden, or the main window
+          is minimized or restored. See FrameWatcher.
+
+        Args:
+            frame: The frame to check.
+        """
+        visible = self.isFrameVisible(frame)
+        if self._frameVisibilities.get(frame) == visible:
+            return
+        self._frameVisibilities[frame] = visible
+        self.frameVisibilityChanged.emit(frame, visible)
+        if visible:
+            self._runFrameUpdate(frame)
+
+    def scheduleFrameUpdate(self, frame: QWidget, update: Callable[[], Any]):
+        """Updates the frame when it is visible, at most frameUpdateRate times per second.
+
+        If the frame is not visible, the update is postponed until it becomes visible.
+        If the frame was updated too recently, the update is postponed until it is allowed.
+        Only the latest postponed update is executed, since it is supposed to overwrite
+          the previous ones.
+
+        Args:
+            frame: The frame to update.
+            update: A function which updates the frame without any argument.
+        """
+        isPending = frame in self._frameUpdates
+        self._frameUpdates[frame] = update
+        if isPending or not self.isFrameVisible(frame):
+            return
+        delay = 0.
+        if self.frameUpdateRate:
+            elapsed = time.monotonic() - self._frameUpdateTimes.get(frame, -math.inf)
+            delay = 1 / self.frameUpdateRate - elapsed
+        if delay > 0:
+            QTimer.singleShot(
+                math.ceil(delay * 1000), functools.partial(self._runFrameUpdate, frame)
+            )
+        else:
+            self._runFrameUpdate(frame)
+
+    def _runFrameUpdate(self, frame: QWidget):
+        """Runs the postponed update of the frame if it is visible.
+
+        Args:
+            frame: The frame to update.
+        """
+        if frame not in self._frameUpdates or not self.isFrameVisible(frame):
+            return
+        self._frameUpdateTimes[frame] = time.monotonic()
+        self._frameUpdates.pop(frame)()
+
     def receivedSlot(self, channelName: str, content: Any):
         """Handles the received broadcast message.
         
@@ -743,22 +2207,93 @@ def set_global_constant_namespace(constants: Mapping[str, JsonType]) -> Tuple:
     return constants_
 
 
+def _is_visible(widget: QWidget) -> bool:
+    """Returns whether the widget can be seen on the screen.
+
+    A widget in a hidden tab of docks is not hidden, but its visible region is empty.
+
+    Args:
+        widget: The widget of interest.
+    """
+    return (
+        widget.isVisible()
+        and not widget.window().isMinimized()
+        and not widget.visibleRegion().isEmpty()
+    )
+
+
+# sys.path is shared by all the threads, hence only one thread adds paths at a time
+_path_lock = threading.RLock()
+
+
 @contextmanager
-def _add_to_path(path: str):
-    """Adds a path temporarily.
+def _add_to_path(*paths: str):
+    """Adds paths temporarily.
 
     Using a 'with' statement, you can import a module without changing sys.path.
+    The paths are added while holding a lock, so that the changes of the threads are not
+      interleaved, e.g., by loadProgressively() and createApp(). Therefore, a thread
+      waits until the modules imported by the other threads are imported.
+
+    Args:
+        *paths: Desired paths to be added. The former path has the higher priority.
+    """
+    with _path_lock:
+        old_path = sys.path
+        sys.path = [*paths, *old_path]
+        try:
+            yield
+        finally:
+            sys.path = old_path
+
+
+def _measure(profiler: Optional[StartupProfiler], name: str, category: str):
+    """Returns a context manager which measures the work if a profiler is given.
 
     Args:
-        path: A desired path to be added. 
+        profiler: The profiler to record the measurement. If None, nothing is measured.
+        name, category: See StartupProfiler.measure().
     """
-    old_path = sys.path
-    sys.path = old_path.copy()
-    sys.path.insert(0, path)
-    try:
-        yield
-    finally:
-        sys.path = old_path
+    return nullcontext() if profiler is None else profiler.measure(name, category)
+
+
+def _import_modules(
+    infos: Iterable[AppInfo],
+    max_workers: Optional[int] = None,
+    profiler: Optional[StartupProfiler] = None,
+):
+    """Imports the modules of the apps concurrently in a thread pool.
+
+    Each module is imported only once, and all the paths are added to sys.path
+      at once since sys.path is shared by the worker threads.
+    A module which is already imported is skipped.
+    When it fails to import a module, the error is only logged here.
+      It will be raised again when the app is actually created.
+
+    Args:
+        infos: AppInfo objects of the apps whose modules will be imported.
+        max_workers: See concurrent.futures.ThreadPoolExecutor.
+        profiler: If given, the import time of each module is measured with it.
+    """
+    def _import(module: str):
+        with _measure(profiler, module, "import"):
+            importlib.import_module(module)
+    infos = tuple(infos)
+    modules = {info.module for info in infos if info.module not in sys.modules}
+    if not modules:
+        return
+    paths = dict.fromkeys(os.path.dirname(info.path) for info in infos)
+    with _add_to_path(*paths), \
+         concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_import, module): module
+            for module in modules
+        }
+        for future in concurrent.futures.as_completed(futures):
+            if future.exception() is not None:
+                logger.error("Failed to import the module %s in advance: %r",
+                             futures[future], future.exception())
+    logger.info("Imported %d module(s) in advance", len(modules))
 
 
 def _get_argparser() -> argparse.ArgumentParser:
@@ -766,6 +2301,16 @@ def _get_argparser() -> argparse.ArgumentParser:
 
     -m, --maximize: Maximizes the initial screen size.
     -c, --config: A path of set-up file.
+    -p, --progressive: Shows the main window first and loads the apps progressively.
+    -w, --watch: Reloads the apps when their module files are changed.
+    --watch-config: Applies the changes of the set-up file when it is changed.
+    --profile-startup: Profiles the startup and writes a Chrome trace file at the path.
+      If the path is omitted, "./startup_profile.json" is used.
+    --restore: Restores the session from the file instead of loading the apps in
+      the set-up file. If the path is omitted, "./session.json" is used.
+    --save-session: Saves the session into the file when qiwis quits.
+      If the path is omitted, "./session.json" is used.
+    --headless: Runs the apps without any window, e.g., on a server without display.
 
     Returns:
         A namespace containing arguments.
@@ -781,6 +2326,34 @@ def _get_argparser() -> argparse.ArgumentParser:
         "-c", "--config", dest="config_path", default="./config.json",
         help="a path of set-up file containing the infomation about app"
     )
+    parser.add_argument(
+        "-p", "--progressive", dest="is_progressive", action="store_true",
+        help="Whether the apps are loaded progressively after showing the main window"
+    )
+    parser.add_argument(
+        "-w", "--watch", dest="is_watching", action="store_true",
+        help="Whether the apps are reloaded when their module files are changed"
+    )
+    parser.add_argument(
+        "--watch-config", dest="is_watching_config", action="store_true",
+        help="Whether the changes of the set-up file are applied when it is changed"
+    )
+    parser.add_argument(
+        "--profile-startup", dest="profile_path", nargs="?", const="./startup_profile.json",
+        help="profiles the startup and writes a Chrome trace file at the given path"
+    )
+    parser.add_argument(
+        "--restore", dest="restore_path", nargs="?", const="./session.json",
+        help="restores the session from the given file instead of the set-up file"
+    )
+    parser.add_argument(
+        "--save-session", dest="session_path", nargs="?", const="./session.json",
+        help="saves the session into the given file when qiwis quits"
+    )
+    parser.add_argument(
+        "--headless", dest="is_headless", action="store_true",
+        help="Whether the apps run without any window, using the offscreen platform"
+    )
     return parser
 
 
@@ -806,6 +2379,8 @@ def _read_config_file(config_path: str) -> Tuple[Dict[str, AppInfo], Dict[str, J
         icon_path: The path of the icon image.
         background_path: The path of the background image.
         background_color: The background color in hexadecimal string.
+        background_scaled: Whether the background image is scaled to fit the window.
+        app_pool_size: The maximum number of the pooled apps. See AppInfo.pooled.
 
     Args:
         config_path: The path of the configuration file.
@@ -838,16 +2413,67 @@ def _immutable(source: JsonType) -> ImmutableJsonType:
     return source
 
 
+def _report_profile_when_loaded(qiwis: Qiwis, profiler: StartupProfiler, path: str):
+    """Prints the report of the profiler and dumps it once all the apps are created.
+
+    The apps which wait for their dependencies are created in the event loop,
+      hence the profiler is reported when loaded signal is emitted for the first time,
+      or immediately if qiwis is not loading any apps.
+
+    Args:
+        qiwis: The qiwis object which loads the apps.
+        profiler: The profiler given to qiwis.
+        path: The path of the dumped file. See StartupProfiler.dump().
+    """
+    def report():
+        if connection is not None:
+            qiwis.loaded.disconnect(connection)
+        tracemalloc.stop()
+        print(profiler.report())
+        profiler.dump(path)
+    connection = None
+    if qiwis.isLoading():
+        connection = qiwis.loaded.connect(report)
+    else:
+        report()
+
+
 def main():
     """Main function that runs when qiwis module is executed rather than imported."""
     args = _get_argparser().parse_args()
     logger.info("Parsed arguments: %s", args)
+    profiler = None
+    if args.profile_path is not None:
+        tracemalloc.start()
+        profiler = StartupProfiler()
     # read set-up information
-    app_infos, constants = _read_config_file(args.config_path)
+    with _measure(profiler, "config", "parse"):
+        app_infos, constants = _read_config_file(args.config_path)
     # start GUI
-    qapp = QApplication(sys.argv)
+    with _measure(profiler, "QApplication", "init"):
+        # the apps may still construct widgets, hence QCoreApplication is not enough
+        argv = [*sys.argv, "-platform", "offscreen"] if args.is_headless else sys.argv
+        qapp = QApplication(argv)
     constants_ = set_global_constant_namespace(constants)
-    _qiwis = Qiwis(app_infos, constants_, args.is_maximized)
+    is_restoring = args.restore_path is not None and os.path.exists(args.restore_path)
+    if args.restore_path is not None and not is_restoring:
+        logger.warning("The session file %s does not exist", args.restore_path)
+    with _measure(profiler, "Qiwis", "init"):
+        _qiwis = Qiwis(
+            {} if is_restoring else app_infos, constants_, args.is_maximized,
+            args.is_progressive, profiler, args.config_path, args.is_headless
+        )
+    if is_restoring:
+        with _measure(profiler, "session", "restore"):
+            _qiwis.restoreSession(args.restore_path)
+    if args.session_path is not None:
+        qapp.aboutToQuit.connect(functools.partial(_qiwis.saveSession, args.session_path))
+    if args.is_watching:
+        _qiwis.watchApps()
+    if args.is_watching_config:
+        _qiwis.watchConfig()
+    if profiler is not None:
+        _report_profile_when_loaded(_qiwis, profiler, args.profile_path)
     logger.info("Now the QApplication starts")
     qapp.exec_()
 
@@ -2,16 +2,28 @@
 Module for testing qiwis module.
 """
 
+# pylint: disable=too-many-lines
+
 import collections.abc
+import contextlib
 import dataclasses
+import importlib
+import io
+import os
 import sys
 import json
+import logging
+import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 from types import MappingProxyType
 from typing import Any, Optional, Mapping, Iterable
 
-from PyQt5.QtCore import QObject
+from PyQt5 import sip
+from PyQt5.QtCore import QEvent, QObject, QPoint, Qt
+from PyQt5.QtGui import QColor, QPixmap
 from PyQt5.QtWidgets import QApplication, QMessageBox, QWidget
 
 import qiwis
@@ -46,19 +58,62 @@ APP_DICTS = {
     }
 }
 
+# app1 with a dependency, whose JSON covers every field of AppInfo
+DEPENDENT_APP_INFO = dataclasses.replace(APP_INFOS["app1"], depends=["app2"])
+
 APP_JSONS = {
-    "app1": ('{"module": "module1", "cls": "cls1", "path": "path1", "pos": "left", '
-             '"channel": ["ch1", "ch2"], "trust": false, "args": {"arg1": "value1"}}'),
+    "app1_dependent": ('{"module": "module1", "cls": "cls1", "path": "path1", "pos": "left", '
+                       '"channel": ["ch1", "ch2"], "trust": false, "args": {"arg1": "value1"}, '
+                       '"depends": ["app2"], "pooled": false}'),
     "app2": ('{"module": "module2", "cls": "cls2", "path": ".", "pos": "", '
-             '"channel": [], "trust": false, "args": null}'),
+             '"channel": [], "trust": false, "args": null, "depends": [], '
+             '"pooled": false}'),
     "app2_default": '{"module": "module2", "cls": "cls2"}'
 }
 
+RELOAD_MODULE = "qiwis_test_reload_app"
+
+RELOAD_SOURCE = """
+from PyQt5.QtWidgets import QWidget
+
+import qiwis
+
+VERSION = {version}
+
+
+class ReloadApp(qiwis.BaseApp):
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent=parent)
+        self.frame = QWidget()
+        self.state = None
+
+    def frames(self):
+        return (("", self.frame),)
+
+    def saveState(self):
+        return VERSION
+
+    def restoreState(self, state):
+        self.state = state
+"""
+
 
 qapp = QApplication(sys.argv)
 
 
-class QiwisTestWithApps(unittest.TestCase):
+def process_events_until(condition, timeout: float = 5):
+    """Processes Qt events until the condition becomes True or the time is out.
+
+    Args:
+        condition: A callable object without arguments, which returns a boolean.
+        timeout: The maximum waiting time in seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        qapp.processEvents()
+
+
+class QiwisTestWithApps(unittest.TestCase):  # pylint: disable=too-many-public-methods
     """Unit test for Qiwis class with creating apps."""
 
     def setUp(self):
@@ -67,6 +122,7 @@ class QiwisTestWithApps(unittest.TestCase):
         for appInfo in APP_INFOS.values():
             app = mock.MagicMock()
             app.cls = appInfo.cls
+            app.deferReady = False
             app.frames.return_value = (("title", QWidget()),)
             cls = mock.MagicMock(return_value=app)
             setattr(self.mocked_import_module.return_value, appInfo.cls, cls)
@@ -133,6 +189,151 @@ class QiwisTestWithApps(unittest.TestCase):
             for channel in info.channel:
                 self.assertNotIn(name, self.qiwis._subscribers[channel])
 
+    def help_pooled_app(self) -> qiwis.AppInfo:
+        """Helper method for testing the pooled apps.
+
+        It creates a pooled app "app3", and then destroys it.
+
+        Returns:
+            The AppInfo object of the pooled app.
+        """
+        app = mock.MagicMock()
+        app.deferReady = False
+        app.frames.return_value = (("title", QWidget()),)
+        setattr(self.mocked_import_module.return_value, "cls3", mock.MagicMock(return_value=app))
+        info = qiwis.AppInfo(module="module3", cls="cls3", pos="center",
+                             channel=["ch1"], pooled=True)
+        self.qiwis.createApp("app3", info)
+        self.qiwis.destroyApp("app3")
+        return info
+
+    def test_destroy_pooled_app(self):
+        self.help_pooled_app()
+        self.assertNotIn("app3", self.qiwis.appNames())
+        self.assertNotIn("app3", self.qiwis._wrapperWidgets)
+        self.assertNotIn("app3", self.qiwis._subscribers["ch1"])
+        self.assertIn("app3", self.qiwis.pooledAppNames())
+
+    def test_revive_pooled_app(self):
+        info = self.help_pooled_app()
+        _, app, wrapperWidgets = self.qiwis._appPool["app3"]
+        self.mocked_import_module.reset_mock()
+        self.qiwis.createApp("app3", info)
+        self.mocked_import_module.assert_not_called()
+        self.assertIs(self.qiwis._apps["app3"], app)
+        self.assertEqual(self.qiwis._wrapperWidgets["app3"], wrapperWidgets)
+        self.assertIn("app3", self.qiwis._subscribers["ch1"])
+        self.assertIn("app3", self.qiwis.readyAppNames())
+        self.assertNotIn("app3", self.qiwis.pooledAppNames())
+
+    def test_create_pooled_app_different_info(self):
+        info = self.help_pooled_app()
+        _, app, _ = self.qiwis._appPool["app3"]
+        self.qiwis.createApp("app3", dataclasses.replace(info, channel=["ch2"]))
+        app.deleteLater.assert_called_once()
+        self.assertNotIn("app3", self.qiwis.pooledAppNames())
+        self.assertIn("app3", self.qiwis._subscribers["ch2"])
+
+    def test_evict_pooled_app(self):
+        self.qiwis.appPoolSize = 0
+        with mock.patch.object(self.qiwis, "_poolApp") as mocked_pool_app:
+            self.help_pooled_app()
+            mocked_pool_app.assert_not_called()
+        self.qiwis.appPoolSize = 1
+        self.help_pooled_app()
+        self.qiwis._appPool["app4"] = self.qiwis._appPool.pop("app3")
+        self.help_pooled_app()
+        self.assertEqual(self.qiwis.pooledAppNames(), ("app3",))
+
+    def test_evict_pooled_app_frame_watcher(self):
+        self.help_pooled_app()
+        _, _, wrapperWidgets = self.qiwis._appPool["app3"]
+        frame = wrapperWidgets[0].widget()
+        self.qiwis._evictPooledApp("app3")
+        self.assertNotIn(frame, self.qiwis.frameWatcher._frameApps)
+        qapp.sendPostedEvents(None, QEvent.DeferredDelete)
+        self.assertTrue(sip.isdeleted(frame))
+        app = self.qiwis._apps["app1"]
+        app.checkFrameVisibility.reset_mock()
+        qapp.sendEvent(self.qiwis.mainWindow, QEvent(QEvent.WindowStateChange))
+        process_events_until(lambda: app.checkFrameVisibility.called)
+        app.checkFrameVisibility.assert_called_once()
+
+    def help_reload_config(self, appInfos: Mapping[str, qiwis.AppInfo], constants: Mapping):
+        """Helper method for testing reloadConfig().
+
+        Args:
+            appInfos, constants: The returned values of the mocked _read_config_file().
+        """
+        self.qiwis.configPath = "config.json"
+        with mock.patch.object(qiwis, "_read_config_file", return_value=(appInfos, constants)):
+            self.qiwis.reloadConfig()
+
+    def test_reload_config(self):
+        orgApp = self.qiwis._apps["app1"]
+        appInfos = {
+            "app1": dataclasses.replace(APP_INFOS["app1"], channel=["ch1", "ch3"]),
+            "app3": qiwis.AppInfo(module="module3", cls="cls3"),
+        }
+        with mock.patch.object(qiwis, "set_global_constant_namespace") as mocked_set_constants:
+            self.help_reload_config(appInfos, {})
+            mocked_set_constants.assert_not_called()
+        self.assertIs(self.qiwis._apps["app1"], orgApp)
+        self.assertEqual(self.qiwis.appInfos["app1"], appInfos["app1"])
+        self.assertIn("app1", self.qiwis._subscribers["ch3"])
+        self.assertNotIn("app1", self.qiwis._subscribers["ch2"])
+        self.assertNotIn("app2", self.qiwis.appNames())
+        self.assertIn("app3", self.qiwis.appNames())
+
+    def test_reload_config_replace(self):
+        appInfos = {**APP_INFOS, "app2": dataclasses.replace(APP_INFOS["app2"], pos="right")}
+        with mock.patch.object(self.qiwis, "createApp") as mocked_create_app:
+            self.help_reload_config(appInfos, {})
+            mocked_create_app.assert_called_once_with("app2", appInfos["app2"], replace=True)
+
+    def test_reload_config_constants(self):
+        with mock.patch.object(qiwis, "set_global_constant_namespace") as mocked_set_constants, \
+             mock.patch.object(self.qiwis, "_applyConstants") as mocked_apply_constants:
+            self.help_reload_config(APP_INFOS, {"C0": 0})
+            mocked_apply_constants.assert_called_once_with(mocked_set_constants.return_value)
+        mocked_set_constants.assert_called_once_with({"C0": 0})
+
+    def test_session(self):
+        self.qiwis._apps["app1"].saveState.return_value = {"value": 1}
+        self.qiwis._apps["app2"].saveState.return_value = None
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.json")
+            self.qiwis.saveSession(path)
+            with open(path, encoding="utf-8") as session_file:
+                session = json.load(session_file)
+            self.assertEqual(session["state"], {"app1": {"value": 1}})
+            self.assertEqual(set(session["app"]), set(APP_INFOS))
+            restored = qiwis.Qiwis()
+            with mock.patch.object(restored.mainWindow, "restoreDockWidget",
+                                   return_value=False) as mocked_restore_dock_widget:
+                restored.restoreSession(path)
+            self.assertEqual(set(restored.appNames()), set(APP_INFOS))
+            self.assertEqual(mocked_restore_dock_widget.call_count, len(APP_INFOS))
+            restored._apps["app1"].restoreState.assert_called_once_with({"value": 1})
+            self.assertIsNone(restored._session)
+
+    def test_reload_config_no_path(self):
+        with self.assertRaises(RuntimeError):
+            self.qiwis.reloadConfig()
+
+    def test_headless(self):
+        for app in self.qiwis._apps.values():
+            app.frames.reset_mock()
+        headless = qiwis.Qiwis(APP_INFOS, isHeadless=True)
+        self.assertIsNone(headless.mainWindow)
+        self.assertIsNone(headless.loadProgressBar)
+        self.assertEqual(set(headless.appNames()), set(APP_INFOS))
+        self.assertFalse(headless._wrapperWidgets)
+        for app in headless._apps.values():
+            app.frames.assert_not_called()
+        headless.updateFrames("app1")
+        headless._apps["app1"].frames.assert_not_called()
+
     def test_update_frames_inclusive(self):
         """Tests for the case where a new frame is added in the return of frames()."""
         orgFramesSet = {wrapper.widget() for wrapper in self.qiwis._wrapperWidgets["app1"]}
@@ -143,6 +344,16 @@ class QiwisTestWithApps(unittest.TestCase):
         finalFramesSet = {wrapper.widget() for wrapper in self.qiwis._wrapperWidgets["app1"]}
         self.assertEqual(finalFramesSet, newFramesSet)
 
+    def test_update_frames_lazy(self):
+        factory = mock.MagicMock(return_value=QWidget())
+        frames = (("title", factory),)
+        self.qiwis._apps["app1"].frames.return_value = frames
+        self.qiwis.updateFrames("app1")
+        self.qiwis.updateFrames("app1")
+        wrapperWidgets = self.qiwis._wrapperWidgets["app1"]
+        self.assertEqual(len(wrapperWidgets), 1)
+        self.assertIs(wrapperWidgets[0].widget().factory, factory)
+
     def test_update_frames_exclusive(self):
         """Tests for the case where a new frame replaced the return of frames()."""
         orgFramesSet = {wrapper.widget() for wrapper in self.qiwis._wrapperWidgets["app1"]}
@@ -183,6 +394,122 @@ class QiwisTestWithApps(unittest.TestCase):
         self.assertNotIn("app1", self.qiwis._subscribers["ch1"])
         self.assertEqual(self.qiwis.unsubscribe("app2", "ch1"), False)
 
+    def test_load_progressively(self):
+        mocked_loaded = mock.MagicMock()
+        progressiveQiwis = qiwis.Qiwis(APP_INFOS, isProgressive=True)
+        progressiveQiwis.loaded.connect(mocked_loaded)
+        self.assertFalse(progressiveQiwis.appNames())
+        process_events_until(lambda: mocked_loaded.called)
+        mocked_loaded.assert_called_once()
+        self.assertEqual(progressiveQiwis.appInfos, APP_INFOS)
+
+    def test_load_progressively_exception(self):
+        """Tests for the case where an app fails to be created during the loading."""
+        mocked_loaded = mock.MagicMock()
+        progressiveQiwis = qiwis.Qiwis(isProgressive=True)
+        progressiveQiwis.loaded.connect(mocked_loaded)
+        appInfos = {"app3": qiwis.AppInfo(module="module3", cls="cls3"), **APP_INFOS}
+        with mock.patch.object(self.mocked_import_module.return_value, "cls3",
+                               side_effect=RuntimeError):
+            progressiveQiwis.loadProgressively(appInfos)
+            process_events_until(lambda: mocked_loaded.called)
+        self.assertEqual(progressiveQiwis.appInfos, APP_INFOS)
+
+    def help_dependency_apps(self, depends3: Iterable[str], depends4: Iterable[str]):
+        """Helper method for testing the dependencies between apps.
+
+        It sets up the mocked classes cls3 and cls4, where cls4 defers its readiness.
+
+        Args:
+            depends3, depends4: AppInfo.depends of app3 and app4, respectively.
+
+        Returns:
+            A dictionary of AppInfo objects of app3 and app4.
+        """
+        for cls, deferReady in (("cls3", False), ("cls4", True)):
+            app = mock.MagicMock()
+            app.deferReady = deferReady
+            app.frames.return_value = ()
+            setattr(self.mocked_import_module.return_value, cls, mock.MagicMock(return_value=app))
+        return {
+            "app3": qiwis.AppInfo(module="module3", cls="cls3", depends=depends3),
+            "app4": qiwis.AppInfo(module="module4", cls="cls4", depends=depends4),
+        }
+
+    def test_load_dependency(self):
+        appInfos = self.help_dependency_apps(["app4", "app1"], [])
+        mocked_loaded = mock.MagicMock()
+        self.qiwis.loaded.connect(mocked_loaded)
+        self.qiwis.load(appInfos)
+        self.assertIn("app4", self.qiwis.appNames())
+        self.assertNotIn("app3", self.qiwis.appNames())
+        self.assertNotIn("app4", self.qiwis.readyAppNames())
+        mocked_loaded.assert_not_called()
+        self.qiwis._setReady("app4")
+        self.assertIn("app3", self.qiwis.appNames())
+        self.assertIn("app3", self.qiwis.readyAppNames())
+        mocked_loaded.assert_called_once()
+
+    def test_load_dependency_cycle(self):
+        appInfos = self.help_dependency_apps(["app4"], ["app3"])
+        mocked_loaded = mock.MagicMock()
+        self.qiwis.loaded.connect(mocked_loaded)
+        self.qiwis.load(appInfos)
+        self.assertNotIn("app3", self.qiwis.appNames())
+        self.assertNotIn("app4", self.qiwis.appNames())
+        mocked_loaded.assert_called_once()
+
+    def test_load_dependency_missing(self):
+        appInfos = self.help_dependency_apps(["app5"], [])
+        mocked_loaded = mock.MagicMock()
+        self.qiwis.loaded.connect(mocked_loaded)
+        with self.assertLogs("qiwis", level="ERROR"):
+            self.qiwis.load({"app3": appInfos["app3"]})
+        self.assertIn("app3", self.qiwis.appNames())
+        mocked_loaded.assert_called_once()
+
+    def test_load_dependency_never_ready(self):
+        appInfos = self.help_dependency_apps(["app4"], [])
+        mocked_loaded = mock.MagicMock()
+        self.qiwis.loaded.connect(mocked_loaded)
+        self.qiwis.load(appInfos)
+        self.assertNotIn("app3", self.qiwis.appNames())
+        self.assertTrue(self.qiwis._readyTimer.isActive())
+        with self.assertLogs("qiwis", level="ERROR"):
+            self.qiwis._readyTimer.timeout.emit()
+        self.assertIn("app3", self.qiwis.appNames())
+        self.assertFalse(self.qiwis._readyTimer.isActive())
+        mocked_loaded.assert_called_once()
+
+    def test_report_profile_when_loaded(self):
+        appInfos = self.help_dependency_apps(["app4"], [])
+        self.qiwis.load(appInfos)
+        self.assertTrue(self.qiwis.isLoading())
+        profiler = mock.MagicMock()
+        profiler.report.return_value = "report"
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            qiwis._report_profile_when_loaded(self.qiwis, profiler, "profile.json")
+            profiler.dump.assert_not_called()
+            self.qiwis._setReady("app4")
+        self.assertFalse(self.qiwis.isLoading())
+        profiler.dump.assert_called_once_with("profile.json")
+        self.assertEqual(stdout.getvalue(), "report\n")
+        self.qiwis.loaded.emit()
+        profiler.dump.assert_called_once()
+
+    def test_destroy_ready_app(self):
+        self.assertIn("app1", self.qiwis.readyAppNames())
+        self.qiwis.destroyApp("app1")
+        self.assertNotIn("app1", self.qiwis.readyAppNames())
+
+    def test_profiler(self):
+        profiler = qiwis.StartupProfiler()
+        qiwis.Qiwis(APP_INFOS, profiler=profiler)
+        measured = {(record.name, record.category) for record in profiler.records}
+        for name in APP_INFOS:
+            for category in ("construct", "frames", "addFrame"):
+                self.assertIn((name, category), measured)
+
     def test_broadcast(self):
         for channelName in self.channels:
             self.qiwis._broadcast(channelName, "test_msg")
@@ -196,6 +523,92 @@ class QiwisTestWithoutApps(unittest.TestCase):
     def setUp(self):
         self.qiwis = qiwis.Qiwis()
 
+    def test_dock_area_index(self):
+        info = qiwis.AppInfo(module="module", cls="cls", pos="left")
+        for title in ("a", "b"):
+            self.qiwis.addFrame("app", title, QWidget(), info)
+        dockA, dockB = self.qiwis._wrapperWidgets["app"]
+        self.assertEqual(list(self.qiwis._areaDockWidgets[Qt.LeftDockWidgetArea]), [dockA, dockB])
+        self.assertIn(dockB, self.qiwis.mainWindow.tabifiedDockWidgets(dockA))
+        self.qiwis.mainWindow.addDockWidget(Qt.RightDockWidgetArea, dockB)
+        self.assertEqual(list(self.qiwis._areaDockWidgets[Qt.LeftDockWidgetArea]), [dockA])
+        self.assertEqual(list(self.qiwis._areaDockWidgets[Qt.RightDockWidgetArea]), [dockB])
+        self.qiwis.removeFrame("app", dockA)
+        self.assertFalse(self.qiwis._areaDockWidgets[Qt.LeftDockWidgetArea])
+
+    def test_add_lazy_frame(self):
+        factory = mock.MagicMock(return_value=QWidget())
+        info = qiwis.AppInfo(module="module", cls="cls", pos="left")
+        self.qiwis.addFrame("app", "a", QWidget(), info)
+        self.qiwis.addFrame("app", "b", factory, info)
+        dockA, dockB = self.qiwis._wrapperWidgets["app"]
+        lazyFrame = dockB.widget()
+        self.assertIsInstance(lazyFrame, qiwis.LazyFrame)
+        dockA.raise_()
+        for _ in range(10):
+            qapp.processEvents()
+        factory.assert_not_called()
+        dockB.raise_()
+        process_events_until(lambda: factory.called)
+        factory.assert_called_once_with()
+        self.assertIs(lazyFrame.frame, factory.return_value)
+
+    def test_frame_watcher(self):
+        app = mock.MagicMock()
+        info = qiwis.AppInfo(module="module", cls="cls", pos="left")
+        frame = QWidget()
+        with mock.patch.dict(self.qiwis._apps, {"app": app}):
+            self.qiwis.addFrame("app", "title", frame, info)
+            process_events_until(lambda: app.checkFrameVisibility.called)
+            app.checkFrameVisibility.reset_mock()
+            self.qiwis._wrapperWidgets["app"][0].hide()
+            process_events_until(lambda: app.checkFrameVisibility.called)
+        app.checkFrameVisibility.assert_called_once_with(frame)
+
+    def test_frame_watcher_deleted_frame(self):
+        app = mock.MagicMock()
+        info = qiwis.AppInfo(module="module", cls="cls", pos="left")
+        frames = (qiwis.LazyFrame(QWidget), QWidget())
+        with mock.patch.dict(self.qiwis._apps, {"app": app}):
+            for frame in frames:
+                self.qiwis.addFrame("app", "title", frame, info)
+            process_events_until(lambda: app.checkFrameVisibility.call_count == 2)
+            app.checkFrameVisibility.reset_mock()
+            sip.delete(frames[0])
+            qapp.sendEvent(self.qiwis.mainWindow, QEvent(QEvent.WindowStateChange))
+            process_events_until(lambda: app.checkFrameVisibility.called)
+        app.checkFrameVisibility.assert_called_once_with(frames[1])
+        self.assertNotIn(frames[0], self.qiwis.frameWatcher._frameApps)
+
+    def test_frame_watcher_lazy(self):
+        app = qiwis.BaseApp("app")
+        info = qiwis.AppInfo(module="module", cls="cls", pos="left")
+        frame = QWidget()
+        update = mock.MagicMock()
+        with mock.patch.dict(self.qiwis._apps, {"app": app}):
+            self.qiwis.addFrame("app", "title", lambda: frame, info)
+            process_events_until(lambda: app.isFrameVisible(frame))
+            wrapperWidget = self.qiwis._wrapperWidgets["app"][0]
+            wrapperWidget.hide()
+            process_events_until(lambda: not app._frameVisibilities[frame])
+            app.scheduleFrameUpdate(frame, update)
+            update.assert_not_called()
+            wrapperWidget.show()
+            process_events_until(lambda: update.called)
+            app.scheduleFrameUpdate(frame, update)
+        self.assertEqual(update.call_count, 2)
+
+    def test_frame_changes(self):
+        info = qiwis.AppInfo(module="module", cls="cls", pos="floating")
+        with self.qiwis.frameChanges():
+            with self.qiwis.frameChanges():
+                self.qiwis.addFrame("app", "title", QWidget(), info)
+            self.assertFalse(self.qiwis.mainWindow.updatesEnabled())
+            self.assertFalse(self.qiwis.mainWindow.layout().isEnabled())
+        self.assertTrue(self.qiwis.mainWindow.updatesEnabled())
+        self.assertTrue(self.qiwis.mainWindow.layout().isEnabled())
+        self.assertTrue(self.qiwis._wrapperWidgets["app"][0].updatesEnabled())
+
     def help_qiwiscall(
         self,
         value: Any,
@@ -295,6 +708,148 @@ class QiwisTestWithoutApps(unittest.TestCase):
         parsed_args = self.qiwis._parseArgs(call_for_test, json_args)
         self.assertEqual(args, parsed_args)
 
+class QiwisReloadTest(unittest.TestCase):
+    """Unit test for reloading apps with a real module file."""
+
+    def setUp(self):
+        self.dont_write_bytecode_patcher = mock.patch.object(sys, "dont_write_bytecode", True)
+        self.dont_write_bytecode_patcher.start()
+        self.tempdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.module_path = os.path.join(self.tempdir.name, f"{RELOAD_MODULE}.py")
+        self.write_module(1)
+        self.qiwis = qiwis.Qiwis()
+        self.info = qiwis.AppInfo(
+            module=RELOAD_MODULE,
+            cls="ReloadApp",
+            path=os.path.join(self.tempdir.name, "."),
+            channel=["ch1"],
+        )
+        self.qiwis.createApp("app", self.info)
+
+    def doCleanups(self):
+        sys.modules.pop(RELOAD_MODULE, None)
+        self.tempdir.cleanup()
+        self.dont_write_bytecode_patcher.stop()
+
+    def write_module(self, version: int):
+        """Writes the source of the app module.
+
+        Args:
+            version: The value of VERSION in the module.
+        """
+        with open(self.module_path, "w", encoding="utf-8") as module_file:
+            module_file.write(RELOAD_SOURCE.format(version=version))
+        importlib.invalidate_caches()
+
+    def test_reload_app(self):
+        orgApp = self.qiwis._apps["app"]
+        self.qiwis.subscribe("app", "ch2")
+        self.write_module(2)
+        self.qiwis.reloadApp("app")
+        app = self.qiwis._apps["app"]
+        self.assertIsNot(app, orgApp)
+        self.assertEqual(sys.modules[RELOAD_MODULE].VERSION, 2)
+        self.assertEqual(app.state, 1)
+        self.assertEqual(self.qiwis.appInfos["app"], self.info)
+        self.assertEqual(len(self.qiwis._wrapperWidgets["app"]), 1)
+        for channel in ("ch1", "ch2"):
+            self.assertIn("app", self.qiwis.subscriberNames(channel))
+
+    def test_reload_app_broken_module(self):
+        orgApp = self.qiwis._apps["app"]
+        with open(self.module_path, "w", encoding="utf-8") as module_file:
+            module_file.write("import qiwis\nclass ReloadApp(qiwis.BaseApp):\n pass\n  x = 1\n")
+        importlib.invalidate_caches()
+        with self.assertLogs("qiwis", level="ERROR"):
+            self.assertFalse(self.qiwis.reloadApp("app"))
+        self.assertIs(self.qiwis._apps["app"], orgApp)
+        self.assertEqual(self.qiwis.appNames(), ("app",))
+        self.assertEqual(len(self.qiwis._wrapperWidgets["app"]), 1)
+        self.assertIn("app", self.qiwis.subscriberNames("ch1"))
+        self.assertEqual(sys.modules[RELOAD_MODULE].VERSION, 1)
+
+    def test_reload_app_broken_class(self):
+        orgApp = self.qiwis._apps["app"]
+        self.qiwis.subscribe("app", "ch2")
+        with open(self.module_path, "w", encoding="utf-8") as module_file:
+            module_file.write("import qiwis\nclass ReloadApp(qiwis.BaseApp):\n"
+                              " def __init__(self, name, parent=None):\n"
+                              "  super().__init__(name, parent=parent)\n"
+                              "  undefined\n")
+        importlib.invalidate_caches()
+        with self.assertLogs("qiwis", level="ERROR"):
+            self.assertFalse(self.qiwis.reloadApp("app"))
+        self.assertIs(self.qiwis._apps["app"], orgApp)
+        self.assertEqual(self.qiwis.appNames(), ("app",))
+        self.assertEqual(len(self.qiwis._wrapperWidgets["app"]), 1)
+        for channel in ("ch1", "ch2"):
+            self.assertIn("app", self.qiwis.subscriberNames(channel))
+
+    def test_watch_apps(self):
+        orgApp = self.qiwis._apps["app"]
+        self.qiwis.watchApps()
+        self.assertIn(self.module_path, self.qiwis.appWatcher.files())
+        self.write_module(2)
+        self.qiwis.appWatcher.fileChanged.emit(self.module_path)
+        process_events_until(lambda: self.qiwis._apps["app"] is not orgApp)
+        self.assertEqual(self.qiwis._apps["app"].state, 1)
+
+    def test_watch_apps_shared_module(self):
+        self.qiwis.createApp("app2", self.info)
+        self.qiwis.subscribe("app2", "ch2")
+        orgApps = dict(self.qiwis._apps)
+        self.qiwis.watchApps()
+        self.write_module(2)
+        self.qiwis.appWatcher.fileChanged.emit(self.module_path)
+        process_events_until(lambda: self.qiwis._apps.get("app2") not in (None, orgApps["app2"]))
+        for name in ("app", "app2"):
+            self.assertIsNot(self.qiwis._apps[name], orgApps[name])
+            self.assertEqual(self.qiwis._apps[name].state, 1)
+        self.assertIn("app2", self.qiwis.subscriberNames("ch2"))
+
+
+class MdiAreaTest(unittest.TestCase):
+    """Unit test for MdiArea class."""
+
+    def setUp(self):
+        self.image = QPixmap(10, 10)
+        self.image.fill(QColor(Qt.black))
+        self.mdiArea = qiwis.MdiArea(self.image, QColor(Qt.white))
+        self.mdiArea.resize(200, 100)
+        self.mdiArea.show()
+
+    def test_render_background(self):
+        background = self.mdiArea._renderBackground().toImage()
+        size = self.mdiArea.viewport().size()
+        center = QPoint(size.width() // 2, size.height() // 2)
+        self.assertEqual(background.pixelColor(center), QColor(Qt.black))
+        self.assertEqual(background.pixelColor(0, 0), QColor(Qt.white))
+
+    def test_render_background_scaled(self):
+        self.mdiArea.setBackground(self.image, QColor(Qt.white), True)
+        background = self.mdiArea._renderBackground().toImage()
+        size = self.mdiArea.viewport().size()
+        self.assertEqual(background.pixelColor(size.width() // 2, 0), QColor(Qt.black))
+        self.assertEqual(background.pixelColor(0, 0), QColor(Qt.white))
+
+    def test_paint_high_dpi(self):
+        with mock.patch.object(self.mdiArea, "devicePixelRatioF", return_value=2.):
+            self.mdiArea._backgroundCache = self.mdiArea._renderBackground()
+        background = self.mdiArea.viewport().grab().toImage()
+        size = self.mdiArea.viewport().size()
+        center = QPoint(size.width() // 2, size.height() // 2)
+        self.assertEqual(background.pixelColor(center), QColor(Qt.black))
+        self.assertEqual(background.pixelColor(0, 0), QColor(Qt.white))
+
+    def test_cache_invalidated(self):
+        self.mdiArea._backgroundCache = QPixmap()
+        self.mdiArea.setBackground(None, QColor(Qt.red))
+        self.assertIsNone(self.mdiArea._backgroundCache)
+        self.mdiArea._backgroundCache = QPixmap()
+        self.mdiArea.resize(300, 300)
+        self.assertIsNone(self.mdiArea._backgroundCache)
+
+
 @mock.patch("qiwis.loads")
 @mock.patch("qiwis.QMessageBox.warning")
 class HandleQiwiscallTest(unittest.TestCase):
@@ -336,6 +891,20 @@ class HandleQiwiscallTest(unittest.TestCase):
         mocked_loads.assert_called_once()
         mocked_warning.assert_called_once()
 
+    def test_headless_untrusted(self, mocked_warning, mocked_loads):
+        args = {"a": 123, "b": "ABC"}
+        info = qiwis.QiwiscallInfo(call="callForTest", args=args)
+        msg = json.dumps({"call": "callForTest", "args": args})
+        mocked_loads.return_value = info
+        app_infos = {"sender": qiwis.AppInfo(module="module", cls="cls")}
+        with mock.patch.multiple(self.qiwis, create=True, appInfos=app_infos, isHeadless=True,
+                                 callForTest=mock.DEFAULT, _parseArgs=mock.DEFAULT):
+            self.qiwis._parseArgs.return_value = args
+            with self.assertRaises(RuntimeError):
+                self.qiwis._handleQiwiscall(sender="sender", msg=msg)
+            self.qiwis.callForTest.assert_not_called()
+        mocked_warning.assert_not_called()
+
     def test_non_public(self, mocked_warning, mocked_loads):
         args = {"a": 123, "b": "ABC"}
         info = qiwis.QiwiscallInfo(call="_callForTest", args=args)
@@ -372,6 +941,18 @@ class BaseAppTest(unittest.TestCase):
     def test_init(self):
         self.assertEqual(self.app.name, "name")
 
+    def test_logger(self):
+        with self.assertLogs("qiwis") as logs:
+            self.app.logger.info("message")
+        self.assertEqual(logs.records[0].app, "name")
+
+    def test_logger_rate_limit(self):
+        filters = logging.getLogger("qiwis").filters
+        qiwis.BaseApp("name2")
+        self.assertEqual(
+            sum(isinstance(filter_, qiwis.RateLimitFilter) for filter_ in filters), 1
+        )
+
     def test_set_parent(self):
         qiwis.BaseApp("name", QObject())
 
@@ -385,6 +966,49 @@ class BaseAppTest(unittest.TestCase):
     def test_frames(self):
         self.assertIsInstance(self.app.frames(), collections.abc.Iterable)
 
+    def test_save_state(self):
+        self.assertIsNone(self.app.saveState())
+        self.app.restoreState(None)
+
+    def test_notify_ready(self):
+        self.app.readyNotified = mock.MagicMock()
+        self.app.notifyReady()
+        self.app.readyNotified.emit.assert_called_once_with()
+
+    def test_frame_visibility(self):
+        frame = QWidget()
+        self.app.frameVisibilityChanged = mock.MagicMock()
+        self.assertFalse(self.app.isFrameVisible(frame))
+        frame.show()
+        self.assertTrue(self.app.isFrameVisible(frame))
+        self.app.checkFrameVisibility(frame)
+        self.app.checkFrameVisibility(frame)
+        self.app.frameVisibilityChanged.emit.assert_called_once_with(frame, True)
+        frame.showMinimized()
+        self.assertFalse(self.app.isFrameVisible(frame))
+
+    def test_schedule_frame_update_hidden(self):
+        frame = QWidget()
+        update, latestUpdate = mock.MagicMock(), mock.MagicMock()
+        self.app.scheduleFrameUpdate(frame, update)
+        self.app.scheduleFrameUpdate(frame, latestUpdate)
+        frame.show()
+        self.app.checkFrameVisibility(frame)
+        update.assert_not_called()
+        latestUpdate.assert_called_once_with()
+
+    def test_schedule_frame_update_throttled(self):
+        frame = QWidget()
+        frame.show()
+        updates = [mock.MagicMock() for _ in range(3)]
+        with mock.patch.object(self.app, "frameUpdateRate", 10):
+            for update in updates:
+                self.app.scheduleFrameUpdate(frame, update)
+            updates[0].assert_called_once_with()
+            updates[1].assert_not_called()
+            process_events_until(lambda: updates[2].called)
+        updates[1].assert_not_called()
+
     def test_broadcast(self):
         self.app.broadcastRequested = mock.MagicMock()
         self.app.broadcast("ch1", "msg")
@@ -527,15 +1151,93 @@ class QiwiscallProxyTest(unittest.TestCase):
             self.assertNotIn("request", self.qiwiscall.results)
 
 
+class StartupProfilerTest(unittest.TestCase):
+    """Unit test for StartupProfiler class."""
+
+    def setUp(self):
+        self.profiler = qiwis.StartupProfiler()
+        for name, category in (("app1", "construct"), ("app1", "frames"), ("app2", "construct")):
+            with self.profiler.measure(name, category):
+                pass
+
+    def test_measure(self):
+        self.assertEqual(len(self.profiler.records), 3)
+        record = self.profiler.records[0]
+        self.assertEqual((record.name, record.category), ("app1", "construct"))
+        self.assertGreaterEqual(record.duration, 0)
+        self.assertEqual(record.memory, 0)
+
+    def test_measure_exception(self):
+        with self.assertRaises(RuntimeError):
+            with self.profiler.measure("app3", "construct"):
+                raise RuntimeError
+        self.assertEqual(self.profiler.records[-1].name, "app3")
+
+    def test_report(self):
+        lines = self.profiler.report().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn("construct", lines[1])
+        self.assertIn("frames", lines[1])
+
+    def test_dump(self):
+        with tempfile.TemporaryDirectory() as dir_path:
+            path = os.path.join(dir_path, "profile.json")
+            self.profiler.dump(path)
+            with open(path, encoding="utf-8") as trace_file:
+                trace = json.load(trace_file)
+        self.assertEqual(len(trace["traceEvents"]), 3)
+        self.assertEqual(trace["traceEvents"][0]["name"], "app1")
+
+
+class RateLimitFilterTest(unittest.TestCase):
+    """Unit test for RateLimitFilter class."""
+
+    def setUp(self):
+        self.filter = qiwis.RateLimitFilter(burst=2, period=10)
+
+    def record(self, app: Optional[str] = None, level: int = logging.WARNING) -> logging.LogRecord:
+        """Returns a new log record created at the same place."""
+        return logging.makeLogRecord({
+            "name": "name", "pathname": "path", "lineno": 1, "msg": "message", "app": app,
+            "levelno": level,
+        })
+
+    @mock.patch("qiwis.time.monotonic")
+    def test_filter(self, mocked_monotonic):
+        mocked_monotonic.return_value = 0
+        self.assertEqual([self.filter.filter(self.record()) for _ in range(4)],
+                         [True, True, False, False])
+        self.assertTrue(self.filter.filter(self.record("app")))
+        mocked_monotonic.return_value = 10
+        record = self.record()
+        self.assertTrue(self.filter.filter(record))
+        self.assertIn("suppressed 2 similar messages", record.getMessage())
+        self.assertFalse(self.filter.filter(self.record()))
+        mocked_monotonic.return_value = 20
+        self.assertEqual([self.filter.filter(self.record()) for _ in range(2)], [True, False])
+        mocked_monotonic.return_value = 30
+        record = self.record()
+        self.assertTrue(self.filter.filter(record))
+        self.assertIn("suppressed 1 similar messages", record.getMessage())
+        mocked_monotonic.return_value = 40
+        self.assertEqual([self.filter.filter(self.record()) for _ in range(3)],
+                         [True, True, False])
+
+    def test_filter_below_level(self):
+        self.assertTrue(all(self.filter.filter(self.record(level=logging.INFO))
+                            for _ in range(10)))
+
+
 class QiwisFunctionTest(unittest.TestCase):
     """Unit test for functions."""
 
     def test_loads(self):
-        self.assertEqual(qiwis.loads(qiwis.AppInfo, APP_JSONS["app1"]), APP_INFOS["app1"])
+        self.assertEqual(qiwis.loads(qiwis.AppInfo, APP_JSONS["app1_dependent"]),
+                         DEPENDENT_APP_INFO)
         self.assertEqual(qiwis.loads(qiwis.AppInfo, APP_JSONS["app2_default"]), APP_INFOS["app2"])
 
     def test_dumps(self):
-        self.assertEqual(qiwis.dumps(APP_INFOS["app1"]), APP_JSONS["app1"])
+        self.assertEqual(qiwis.dumps(DEPENDENT_APP_INFO), APP_JSONS["app1_dependent"])
         self.assertEqual(qiwis.dumps(APP_INFOS["app2"]), APP_JSONS["app2"])
 
     @mock.patch("qiwis.namedtuple")
@@ -607,6 +1309,50 @@ class QiwisFunctionTest(unittest.TestCase):
             self.assertIn(test_dir, sys.path)
         self.assertEqual(old_path, sys.path)
 
+    def test_add_to_path_multiple(self):
+        test_dirs = ("/test_dir1", "/test_dir2")
+        old_path = sys.path.copy()
+        with qiwis._add_to_path(*test_dirs):
+            self.assertSequenceEqual(sys.path[:2], test_dirs)
+        self.assertEqual(old_path, sys.path)
+
+    def test_add_to_path_threads(self):
+        old_path = sys.path.copy()
+        entered, released = threading.Event(), threading.Event()
+        paths = []
+        def add_and_wait():
+            with qiwis._add_to_path("/test_dir1"):
+                entered.set()
+                released.wait(5)
+        def add():
+            with qiwis._add_to_path("/test_dir2"):
+                paths.append(sys.path.copy())
+        waiting_thread = threading.Thread(target=add_and_wait)
+        waiting_thread.start()
+        entered.wait(5)
+        thread = threading.Thread(target=add)
+        thread.start()
+        thread.join(0.1)
+        self.assertFalse(paths)
+        released.set()
+        waiting_thread.join(5)
+        thread.join(5)
+        self.assertEqual(paths, [["/test_dir2", *old_path]])
+        self.assertEqual(old_path, sys.path)
+
+    @mock.patch("importlib.import_module")
+    def test_import_modules(self, mocked_import_module):
+        infos = (*APP_INFOS.values(), qiwis.AppInfo(module="module1", cls="cls3"))
+        qiwis._import_modules(infos)
+        self.assertEqual(mocked_import_module.call_count, 2)
+        for info in APP_INFOS.values():
+            mocked_import_module.assert_any_call(info.module)
+
+    @mock.patch("importlib.import_module", side_effect=ImportError)
+    def test_import_modules_exception(self, mocked_import_module):
+        qiwis._import_modules(APP_INFOS.values())
+        self.assertEqual(mocked_import_module.call_count, len(APP_INFOS))
+
     @mock.patch.object(sys, "argv", ["", "-c", "test_config.json"])
     def test_get_argparser(self):
         parser = qiwis._get_argparser()
@@ -617,6 +1363,18 @@ class QiwisFunctionTest(unittest.TestCase):
     def test_get_argparser_default(self):
         args = qiwis._get_argparser().parse_args()
         self.assertEqual(args.config_path, "./config.json")
+        self.assertIsNone(args.profile_path)
+        self.assertFalse(args.is_headless)
+
+    @mock.patch.object(sys, "argv", ["", "--profile-startup"])
+    def test_get_argparser_profile(self):
+        args = qiwis._get_argparser().parse_args()
+        self.assertEqual(args.profile_path, "./startup_profile.json")
+
+    @mock.patch.object(sys, "argv", ["", "--headless"])
+    def test_get_argparser_headless(self):
+        args = qiwis._get_argparser().parse_args()
+        self.assertTrue(args.is_headless)
 
     @mock.patch("builtins.open")
     @mock.patch("json.load", return_value={"app": APP_DICTS, "constant": {"C0": 0}})
@@ -640,6 +1398,8 @@ class QiwisFunctionTest(unittest.TestCase):
         mock_get_argparser,
         mock_set_global_constant_namespace,
     ):
+        args = mock_get_argparser.return_value.parse_args.return_value
+        args.profile_path = args.restore_path = args.session_path = None
         qiwis.main()
         mock_set_global_constant_namespace.assert_called_once()
         mock_get_argparser.assert_called_once()